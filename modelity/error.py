@@ -33,10 +33,12 @@ class ErrorCode:
     UNICODE_DECODE_ERROR = "modelity.UnicodeDecodeError"
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(init=False)
 class Error:
     """Object describing error."""
 
+    __slots__ = ("loc", "code", "data", "msg")
+
     #: Location of the error.
     loc: Loc
 
@@ -44,10 +46,17 @@ class Error:
     code: str
 
     #: Optional error data, with format depending on the :attr:`code`.
-    data: Optional[dict] = None
+    data: Optional[dict]
 
     #: Formatted error message.
-    msg: Optional[str] = None
+    msg: Optional[str]
+
+    def __init__(self, loc: Loc, code: str, data: Optional[dict] = None, msg: Optional[str] = None):
+        # Written by hand, as field defaults would clash with the slots
+        self.loc = loc
+        self.code = code
+        self.data = data
+        self.msg = msg
 
 
 def get_builtin_error_creator() -> IErrorCreator:
@@ -40,9 +40,8 @@ class ParsingError(ModelError):
 
     def __str__(self):
         out = [f"parsing failed with {len(self.errors)} error(-s):"]
-        for error in sorted(self.errors, key=lambda x: x.loc):
-            out.append(f"  {error.loc}:")
-            out.append(f"    {error.msg} [code={error.code}, data={error.data}]")
+        for error in sorted(self.errors, key=lambda x: tuple(x.loc)):
+            out.append(f"  {error.loc}:\n    {error.msg} [code={error.code}, data={error.data}]")
         return "\n".join(out)
 
 
@@ -69,8 +68,7 @@ class ValidationError(ModelError):
     def __str__(self):
         out = [f"validation of model {self.model.__class__.__qualname__!r} failed with {len(self.errors)} error(-s):"]
         for error in sorted(self.errors, key=lambda x: str(x.loc)):
-            out.append(f"  {error.loc}:")
-            out.append(f"    {error.msg} [code={error.code}, data={error.data}]")
+            out.append(f"  {error.loc}:\n    {error.msg} [code={error.code}, data={error.data}]")
         return "\n".join(out)
 
 
@@ -18,10 +18,10 @@ class Loc(collections.abc.Iterable):
         return self._path[index]
 
     def __repr__(self) -> str:
-        return f"Loc({', '.join(repr(x) for x in self._path)})"
+        return f"Loc({', '.join(map(repr, self._path))})"
 
     def __str__(self) -> str:
-        return ".".join(str(x) for x in self)
+        return ".".join(map(str, self._path))
 
     def __lt__(self, value: object) -> bool:
         if not isinstance(value, Loc):
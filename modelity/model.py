@@ -653,9 +653,10 @@ class Model(metaclass=ModelMeta):
 
     def __setattr__(self, name: str, value: Any):
         cls = self.__class__
-        if name not in cls.__fields__ and name.startswith("_"):
-            return super().__setattr__(name, value)
-        if name not in cls.__fields__:
+        field = cls.__fields__.get(name)
+        if field is None:
+            if name.startswith("_"):
+                return super().__setattr__(name, value)
             raise AttributeError(f"{cls.__name__!r} model has no field named {name!r}")
         config = self._config
         self._fields_set.discard(name)
@@ -667,7 +668,6 @@ class Model(metaclass=ModelMeta):
             if isinstance(value, Invalid):
                 break
         if not isinstance(value, Invalid):
-            field = cls.__fields__[name]
             parser = config.type_parser_provider.provide_type_parser(field.type, config)
             value = parser(value, loc, config)
         if not isinstance(value, Invalid):
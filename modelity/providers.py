@@ -128,6 +128,7 @@ class CachingTypeParserProviderProxy:
         return self._target.get_type_parser_factory(tp)
 
     def provide_type_parser(self, tp: Type[T], model_config: IConfig) -> IParser[T]:
-        if tp not in self._cache:
-            self._cache[tp] = self._target.provide_type_parser(tp, model_config)
-        return self._cache[tp]
+        parser = self._cache.get(tp)
+        if parser is None:
+            parser = self._cache[tp] = self._target.provide_type_parser(tp, model_config)
+        return parser
@@ -53,6 +53,13 @@ class Response(Model):
             raise ValueError("cannot set both 'error' and 'result' fields")
 
 
+_JSONRPC_REQUIRED = ErrorFactoryHelper.required_missing(Loc("jsonrpc"))
+_METHOD_REQUIRED = ErrorFactoryHelper.required_missing(Loc("method"))
+_ID_REQUIRED = ErrorFactoryHelper.required_missing(Loc("id"))
+_PARAMS_UNSUPPORTED_TYPE = ErrorFactoryHelper.unsupported_type(Loc("params"), (list, dict))
+_NEITHER_ERROR_NOR_RESULT = ErrorFactoryHelper.value_error(Loc(), "neither 'error' nor 'result' field set")
+
+
 class TestNotification:
 
     @pytest.fixture
@@ -124,8 +131,8 @@ class TestNotification:
         @pytest.mark.parametrize(
             "value, expected_errors",
             [
-                (123, [ErrorFactoryHelper.unsupported_type(Loc("params"), (list, dict))]),
-                (None, [ErrorFactoryHelper.unsupported_type(Loc("params"), (list, dict))]),
+                (123, [_PARAMS_UNSUPPORTED_TYPE]),
+                (None, [_PARAMS_UNSUPPORTED_TYPE]),
             ],
         )
         def test_params_invalid(self, value, expected_errors):
@@ -153,8 +160,8 @@ class TestNotification:
             (
                 {},
                 [
-                    ErrorFactoryHelper.required_missing(Loc("jsonrpc")),
-                    ErrorFactoryHelper.required_missing(Loc("method")),
+                    _JSONRPC_REQUIRED,
+                    _METHOD_REQUIRED,
                 ],
             ),
         ],
@@ -225,9 +232,9 @@ class TestRequest:
             (
                 {},
                 [
-                    ErrorFactoryHelper.required_missing(Loc("jsonrpc")),
-                    ErrorFactoryHelper.required_missing(Loc("method")),
-                    ErrorFactoryHelper.required_missing(Loc("id")),
+                    _JSONRPC_REQUIRED,
+                    _METHOD_REQUIRED,
+                    _ID_REQUIRED,
                 ],
             ),
         ],
@@ -270,6 +277,7 @@ class TestError:
                 Error(code=-32601, message="Method not found", data=True),
             ),
         ],
+        ids=["no-data", "str-data", "bool-like-str-data", "int-data", "float-data", "bool-data"],
     )
     def test_create_valid_object(self, obj: Error, expected_obj):
         obj.validate()
@@ -309,6 +317,7 @@ class TestResponse:
                 Response(jsonrpc="2.0", error=Error(code=404, message="Not found"), id=1),
             ),
         ],
+        ids=["result", "error"],
     )
     def test_create_valid_object(self, obj: Response, expected_obj):
         obj.validate()
@@ -320,14 +329,14 @@ class TestResponse:
             (
                 {},
                 [
-                    ErrorFactoryHelper.required_missing(Loc("jsonrpc")),
-                    ErrorFactoryHelper.required_missing(Loc("id")),
-                    ErrorFactoryHelper.value_error(Loc(), "neither 'error' nor 'result' field set"),
+                    _JSONRPC_REQUIRED,
+                    _ID_REQUIRED,
+                    _NEITHER_ERROR_NOR_RESULT,
                 ],
             ),
             (
                 {"jsonrpc": "2.0", "id": 1},
-                [ErrorFactoryHelper.value_error(Loc(), "neither 'error' nor 'result' field set")],
+                [_NEITHER_ERROR_NOR_RESULT],
             ),
             (
                 {"jsonrpc": "2.0", "id": 1, "error": {}},
@@ -343,6 +352,7 @@ class TestResponse:
                 ],
             ),
         ],
+        ids=["empty", "no-result-nor-error", "empty-error", "both-result-and-error"],
     )
     def test_create_invalid_object(self, obj: Response, expected_errors):
         with pytest.raises(ValidationError) as excinfo:
@@ -1,6 +1,5 @@
 import datetime
 import enum
-from re import L
 from typing import Annotated, Any, Dict, List, Literal, Optional, Set, Tuple, Type, Union
 
 import pytest
@@ -15,183 +14,175 @@ from modelity.constraints import MaxValue, MinValue
 from tests.helpers import ErrorFactoryHelper
 
 
-def make_error(loc: Loc, code: str, **data: Any) -> Error:
-    return Error(loc, code, data)
+def make_parser(tp: Type, model_config: IConfig) -> IParser:
+    return model_config.type_parser_provider.provide_type_parser(tp, model_config)
 
 
-@pytest.fixture
+_config = Config()
+
+_EMPTY_LOC = Loc()
+
+# Types checked by the collection interface tests
+_LIST_INT = List[int]
+_DICT_STR_INT = Dict[str, int]
+_SET_INT = Set[int]
+
+# Parsers used by the collection interface tests; these are built once, as
+# only calling the parser has to be done per test
+_LIST_INT_PARSER = make_parser(_LIST_INT, _config)
+_DICT_STR_INT_PARSER = make_parser(_DICT_STR_INT, _config)
+_SET_INT_PARSER = make_parser(_SET_INT, _config)
+
+
+# Errors reported by the collection interface tests when an item cannot be
+# parsed; these are always reported at the empty location
+_INT_REQ = ErrorFactoryHelper.integer_required(_EMPTY_LOC)
+_STR_REQ = ErrorFactoryHelper.string_required(_EMPTY_LOC)
+
+# Expected errors of collection parsers given input of wrong type
+_ITER_REQ = (ErrorFactoryHelper.iterable_required(_EMPTY_LOC),)
+_MAP_REQ = (ErrorFactoryHelper.mapping_required(_EMPTY_LOC),)
+
+# Expected errors shared by several rows of the tuple parser failure table
+_INVALID_INT_STR_FLOAT_TUPLE = (ErrorFactoryHelper.invalid_tuple_format(_EMPTY_LOC, expected_format=(int, str, float)),)
+
+# Expected error shared by several rows of the annotated parser failure table
+_TOO_LOW_MIN_1 = ErrorFactoryHelper.value_too_low(_EMPTY_LOC, min_inclusive=1)
+
+
+def assert_invalid(result: Any, value: Any, errors: tuple):
+    assert type(result) is Invalid, f"given={value!r}"
+    assert result.value == value
+    assert result.errors == errors, f"given={value!r}"
+
+
+@pytest.fixture(scope="session")
 def model_config():
-    return Config()
+    return _config
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def config(model_config):
     return model_config
 
 
 @pytest.fixture
 def parser(model_config: IConfig, tp: Type):
-    return model_config.type_parser_provider.provide_type_parser(tp, model_config)
+    return make_parser(tp, model_config)
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
+def class_parser(request, model_config: IConfig):
+    # Parser for the type given by the ``tp`` attribute of the test class
+    return make_parser(request.cls.tp, model_config)
+
+
+@pytest.fixture(scope="session")
 def loc():
-    return Loc()
+    return _EMPTY_LOC
+
+
+def run_cases(parser: IParser, loc: Loc, config: IConfig, cases: list):
+    for given, expected in cases:
+        assert parser(given, loc, config) == expected, f"given={given!r}"
 
 
 class TestNoneParser:
 
-    @pytest.fixture
-    def tp(self):
-        return type(None)
+    tp = type(None)
 
-    @pytest.mark.parametrize(
-        "given, expected",
-        [
+    def test_successfully_parse_input_value(self, class_parser: IParser, loc, config):
+        cases = [
             (None, None),
-        ],
-    )
-    def test_successfully_parse_input_value(self, parser: IParser, loc, config, given, expected):
-        assert parser(given, loc, config) == expected
+        ]
+        run_cases(class_parser, loc, config, cases)
 
-    @pytest.mark.parametrize("given", [123, "spam"])
-    def test_parsing_fails_if_input_cannot_be_parsed(self, parser: IParser, loc, config, given):
-        result = parser(given, loc, config)
-        assert isinstance(result, Invalid)
-        assert result.value == given
-        assert result.errors == tuple([ErrorFactoryHelper.none_required(loc)])
+    def test_parsing_fails_if_input_cannot_be_parsed(self, class_parser: IParser, loc, config):
+        expected_errors = (ErrorFactoryHelper.none_required(loc),)
+        for given in [123, "spam"]:
+            result = class_parser(given, loc, config)
+            assert_invalid(result, given, expected_errors)
 
 
 class TestIntParser:
 
-    @pytest.fixture
-    def tp(self):
-        return int
+    tp = int
 
-    @pytest.mark.parametrize(
-        "given, expected",
-        [
+    def test_successfully_parse_input_value(self, class_parser: IParser, loc, config):
+        cases = [
             (1, 1),
             ("2", 2),
-        ],
-    )
-    def test_successfully_parse_input_value(self, parser: IParser, loc, config, given, expected):
-        assert parser(given, loc, config) == expected
+        ]
+        run_cases(class_parser, loc, config, cases)
 
-    @pytest.mark.parametrize(
-        "given",
-        [
-            "foo",
-            "3.14",
-            [],
-            {},
-            set(),
-            tuple(),
-        ],
-    )
-    def test_parsing_fails_if_input_cannot_be_parsed(self, parser: IParser, loc, config, given):
-        result = parser(given, loc, config)
-        assert isinstance(result, Invalid)
-        assert result.value == given
-        assert result.errors == tuple([ErrorFactoryHelper.integer_required(loc)])
+    def test_parsing_fails_if_input_cannot_be_parsed(self, class_parser: IParser, loc, config):
+        expected_errors = (ErrorFactoryHelper.integer_required(loc),)
+        for given in ["foo", "3.14", [], {}, set(), ()]:
+            result = class_parser(given, loc, config)
+            assert_invalid(result, given, expected_errors)
 
 
 class TestFloatParser:
 
-    @pytest.fixture
-    def tp(self):
-        return float
+    tp = float
 
-    @pytest.mark.parametrize(
-        "given, expected",
-        [
+    def test_successfully_parse_input_value(self, class_parser: IParser, loc, config):
+        cases = [
             (1, 1.0),
             ("2.1", 2.1),
-        ],
-    )
-    def test_successfully_parse_input_value(self, parser: IParser, loc, config, given, expected):
-        assert parser(given, loc, config) == expected
+        ]
+        run_cases(class_parser, loc, config, cases)
 
-    @pytest.mark.parametrize(
-        "given",
-        [
-            "foo",
-            [],
-            {},
-            set(),
-            tuple(),
-        ],
-    )
-    def test_parsing_fails_if_input_cannot_be_parsed(self, parser: IParser, loc, config, given):
-        result = parser(given, loc, config)
-        assert isinstance(result, Invalid)
-        assert result.value == given
-        assert result.errors == tuple([ErrorFactoryHelper.float_required(loc)])
+    def test_parsing_fails_if_input_cannot_be_parsed(self, class_parser: IParser, loc, config):
+        expected_errors = (ErrorFactoryHelper.float_required(loc),)
+        for given in ["foo", [], {}, set(), ()]:
+            result = class_parser(given, loc, config)
+            assert_invalid(result, given, expected_errors)
 
 
 class TestStrParser:
 
-    @pytest.fixture
-    def tp(self):
-        return str
+    tp = str
 
-    @pytest.mark.parametrize(
-        "given, expected",
-        [
+    def test_successfully_parse_input_value(self, class_parser: IParser, loc, config):
+        cases = [
             ("foo", "foo"),
             (b"foo", "foo"),
-        ],
-    )
-    def test_successfully_parse_input_value(self, parser: IParser, loc, config, given, expected):
-        assert parser(given, loc, config) == expected
+        ]
+        run_cases(class_parser, loc, config, cases)
 
-    @pytest.mark.parametrize(
-        "given, expected_error_func",
-        [
-            (123, lambda loc: ErrorFactoryHelper.string_required(loc)),
-            (b"\xff", lambda loc: ErrorFactoryHelper.unicode_decode_error(loc, "utf-8")),
-        ],
-    )
-    def test_parsing_fails_if_input_cannot_be_parsed(self, parser: IParser, loc, config, given, expected_error_func):
-        result = parser(given, loc, config)
-        assert isinstance(result, Invalid)
-        assert result.value == given
-        assert result.errors == (expected_error_func(loc),)
+    def test_parsing_fails_if_input_cannot_be_parsed(self, class_parser: IParser, loc, config):
+        cases = [
+            (123, (_STR_REQ,)),
+            (b"\xff", (ErrorFactoryHelper.unicode_decode_error(_EMPTY_LOC, "utf-8"),)),
+        ]
+        for given, expected_errors in cases:
+            result = class_parser(given, loc, config)
+            assert_invalid(result, given, expected_errors)
 
 
 class TestBytesParser:
 
-    @pytest.fixture
-    def tp(self):
-        return bytes
+    tp = bytes
 
-    @pytest.mark.parametrize(
-        "given, expected",
-        [
+    def test_successfully_parse_input_value(self, class_parser: IParser, loc, config):
+        cases = [
             (b"foo", b"foo"),
             ("foo", b"foo"),
-        ],
-    )
-    def test_successfully_parse_input_value(self, parser: IParser, loc, config, given, expected):
-        assert parser(given, loc, config) == expected
+        ]
+        run_cases(class_parser, loc, config, cases)
 
-    @pytest.mark.parametrize("given", [123])
-    def test_parsing_fails_if_input_cannot_be_parsed(self, parser: IParser, loc, config, given):
-        result = parser(given, loc, config)
-        assert isinstance(result, Invalid)
-        assert result.value == given
-        assert result.errors == tuple([ErrorFactoryHelper.bytes_required(loc)])
+    def test_parsing_fails_if_input_cannot_be_parsed(self, class_parser: IParser, loc, config):
+        result = class_parser(123, loc, config)
+        assert_invalid(result, 123, (ErrorFactoryHelper.bytes_required(loc),))
 
 
 class TestBoolParser:
 
-    @pytest.fixture
-    def tp(self):
-        return bool
+    tp = bool
 
-    @pytest.mark.parametrize(
-        "given, expected",
-        [
+    def test_successfully_parse_input_value(self, class_parser: IParser, loc, config):
+        cases = [
             (True, True),
             (1, True),
             ("on", True),
@@ -200,92 +191,72 @@ class TestBoolParser:
             (0, False),
             ("off", False),
             ("false", False),
-        ],
-    )
-    def test_successfully_parse_input_value(self, parser: IParser, loc, config, given, expected):
-        assert parser(given, loc, config) == expected
+        ]
+        run_cases(class_parser, loc, config, cases)
 
-    @pytest.mark.parametrize("given", [2, None, "dummy", [], {}])
-    def test_parsing_fails_if_input_cannot_be_parsed(self, parser: IParser, loc, config, given):
-        result = parser(given, loc, config)
-        assert isinstance(result, Invalid)
-        assert result.value == given
-        assert result.errors == tuple([ErrorFactoryHelper.boolean_required(loc)])
+    def test_parsing_fails_if_input_cannot_be_parsed(self, class_parser: IParser, loc, config):
+        expected_errors = (ErrorFactoryHelper.boolean_required(loc),)
+        for given in [2, None, "dummy", [], {}]:
+            result = class_parser(given, loc, config)
+            assert_invalid(result, given, expected_errors)
 
 
 class TestDateTimeParser:
 
-    @pytest.fixture
-    def tp(self):
-        return datetime.datetime
+    tp = datetime.datetime
+    DATETIME_REQUIRED = (ErrorFactoryHelper.datetime_required(_EMPTY_LOC),)
+    UNKNOWN_DATETIME_FORMAT = (
+        ErrorFactoryHelper.unknown_datetime_format(
+            _EMPTY_LOC,
+            supported_formats=(
+                "Y-m-dTH:M:S",
+                "Y-m-d H:M:S",
+                "YmdHMS",
+                "Y-m-dTH:M:Sz",
+                "Y-m-d H:M:Sz",
+                "YmdHMSz",
+            ),
+        ),
+    )
+
+    NAIVE = datetime.datetime(1999, 1, 2, 11, 22, 33)
+    UTC = NAIVE.replace(tzinfo=datetime.timezone.utc)
+    PLUS_1H = NAIVE.replace(tzinfo=datetime.timezone(datetime.timedelta(hours=1)))
+    PLUS_90M = NAIVE.replace(tzinfo=datetime.timezone(datetime.timedelta(minutes=90)))
+    MINUS_1H = NAIVE.replace(tzinfo=datetime.timezone(datetime.timedelta(hours=-1)))
+    MINUS_90M = NAIVE.replace(tzinfo=datetime.timezone(datetime.timedelta(minutes=-90)))
 
     @pytest.mark.parametrize(
         "given, expected",
         [
             (datetime.datetime(1999, 1, 1, 10, 11, 12), datetime.datetime(1999, 1, 1, 10, 11, 12)),
-            ("1999-01-02T11:22:33", datetime.datetime(1999, 1, 2, 11, 22, 33)),
-            ("1999-01-02 11:22:33", datetime.datetime(1999, 1, 2, 11, 22, 33)),
-            ("1999-01-02T11:22:33Z", datetime.datetime(1999, 1, 2, 11, 22, 33, tzinfo=datetime.timezone.utc)),
-            ("1999-01-02 11:22:33+00:00", datetime.datetime(1999, 1, 2, 11, 22, 33, tzinfo=datetime.timezone.utc)),
-            ("19990102112233+00:00", datetime.datetime(1999, 1, 2, 11, 22, 33, tzinfo=datetime.timezone.utc)),
-            ("19990102112233+0000", datetime.datetime(1999, 1, 2, 11, 22, 33, tzinfo=datetime.timezone.utc)),
-            ("19990102112233", datetime.datetime(1999, 1, 2, 11, 22, 33)),
-            (
-                "1999-01-02T11:22:33+01:00",
-                datetime.datetime(1999, 1, 2, 11, 22, 33, tzinfo=datetime.timezone(datetime.timedelta(hours=1))),
-            ),
-            (
-                "1999-01-02T11:22:33+01:30",
-                datetime.datetime(1999, 1, 2, 11, 22, 33, tzinfo=datetime.timezone(datetime.timedelta(minutes=90))),
-            ),
-            (
-                "1999-01-02T11:22:33-01:00",
-                datetime.datetime(1999, 1, 2, 11, 22, 33, tzinfo=datetime.timezone(datetime.timedelta(hours=-1))),
-            ),
-            (
-                "1999-01-02T11:22:33-01:30",
-                datetime.datetime(1999, 1, 2, 11, 22, 33, tzinfo=datetime.timezone(datetime.timedelta(minutes=-90))),
-            ),
-            (
-                "19990102112233-0130",
-                datetime.datetime(1999, 1, 2, 11, 22, 33, tzinfo=datetime.timezone(datetime.timedelta(minutes=-90))),
-            ),
-            (
-                "19990102112233+0130",
-                datetime.datetime(1999, 1, 2, 11, 22, 33, tzinfo=datetime.timezone(datetime.timedelta(minutes=90))),
-            ),
+            ("1999-01-02T11:22:33", NAIVE),
+            ("1999-01-02 11:22:33", NAIVE),
+            ("1999-01-02T11:22:33Z", UTC),
+            ("1999-01-02 11:22:33+00:00", UTC),
+            ("19990102112233+00:00", UTC),
+            ("19990102112233+0000", UTC),
+            ("19990102112233", NAIVE),
+            ("1999-01-02T11:22:33+01:00", PLUS_1H),
+            ("1999-01-02T11:22:33+01:30", PLUS_90M),
+            ("1999-01-02T11:22:33-01:00", MINUS_1H),
+            ("1999-01-02T11:22:33-01:30", MINUS_90M),
+            ("19990102112233-0130", MINUS_90M),
+            ("19990102112233+0130", PLUS_90M),
         ],
     )
-    def test_successfully_parse_input_value(self, parser: IParser, loc, config, given, expected):
-        assert parser(given, loc, config) == expected
+    def test_successfully_parse_input_value(self, class_parser: IParser, loc, config, given, expected):
+        assert class_parser(given, loc, config) == expected
 
     @pytest.mark.parametrize("given", [123, None, [], {}])
-    def test_parsing_fails_if_input_has_wrong_type(self, parser: IParser, loc, config, given):
-        result = parser(given, loc, config)
-        assert isinstance(result, Invalid)
-        assert result.value == given
-        assert result.errors == tuple([ErrorFactoryHelper.datetime_required(loc)])
+    def test_parsing_fails_if_input_has_wrong_type(self, class_parser: IParser, loc, config, given):
+        result = class_parser(given, loc, config)
+        assert_invalid(result, given, self.DATETIME_REQUIRED)
 
     @pytest.mark.parametrize("given", ["not a datetime"])
-    def test_parsing_fails_if_input_has_incorrect_datetime_format(self, parser: IParser, loc, config, given):
-        result = parser(given, loc, config)
-        assert isinstance(result, Invalid)
-        assert result.value == given
-        assert result.errors == tuple(
-            [
-                ErrorFactoryHelper.unknown_datetime_format(
-                    loc,
-                    supported_formats=(
-                        "Y-m-dTH:M:S",
-                        "Y-m-d H:M:S",
-                        "YmdHMS",
-                        "Y-m-dTH:M:Sz",
-                        "Y-m-d H:M:Sz",
-                        "YmdHMSz",
-                    ),
-                )
-            ]
-        )
+    def test_parsing_fails_if_input_has_incorrect_datetime_format(self, class_parser: IParser, loc, config, given):
+        result = class_parser(given, loc, config)
+        assert_invalid(result, given, self.UNKNOWN_DATETIME_FORMAT)
 
 
 class TestEnumParser:
@@ -295,9 +266,9 @@ class TestEnumParser:
         BAR = 2
         BAZ = 3
 
-    @pytest.fixture
-    def tp(self):
-        return self.Dummy
+    tp = Dummy
+    SUPPORTED = tuple(Dummy)
+    INVALID_ENUM = (ErrorFactoryHelper.invalid_enum(_EMPTY_LOC, allowed_values=SUPPORTED),)
 
     @pytest.mark.parametrize(
         "given, expected",
@@ -307,8 +278,8 @@ class TestEnumParser:
             (3, Dummy.BAZ),
         ],
     )
-    def test_successfully_parse_input_value(self, parser: IParser, loc, config, given, expected):
-        assert parser(given, loc, config) == expected
+    def test_successfully_parse_input_value(self, class_parser: IParser, loc, config, given, expected):
+        assert class_parser(given, loc, config) == expected
 
     @pytest.mark.parametrize(
         "given",
@@ -316,18 +287,9 @@ class TestEnumParser:
             0,
         ],
     )
-    def test_parsing_fails_if_input_value_does_not_match_any_enum(self, parser: IParser, given, loc, config):
-        result = parser(given, loc, config)
-        assert isinstance(result, Invalid)
-        assert result.value == given
-        assert result.errors == tuple(
-            [
-                ErrorFactoryHelper.invalid_enum(
-                    loc,
-                    allowed_values=(self.Dummy.FOO, self.Dummy.BAR, self.Dummy.BAZ),
-                )
-            ]
-        )
+    def test_parsing_fails_if_input_value_does_not_match_any_enum(self, class_parser: IParser, given, loc, config):
+        result = class_parser(given, loc, config)
+        assert_invalid(result, given, self.INVALID_ENUM)
 
 
 class TestLiteralParser:
@@ -342,29 +304,30 @@ class TestLiteralParser:
         assert parser(given, loc, config) == given
 
     @pytest.mark.parametrize(
-        "tp, given, supported_values",
+        "tp, given, expected_errors",
         [
-            (Literal["foo"], "bar", ["foo"]),
+            (Literal["foo"], "bar", (ErrorFactoryHelper.invalid_literal(_EMPTY_LOC, allowed_values=("foo",)),)),
         ],
     )
-    def test_parsing_fails_if_input_value_is_out_of_literal_range(self, parser: IParser, loc, config, given, supported_values):
+    def test_parsing_fails_if_input_value_is_out_of_literal_range(self, parser: IParser, loc, config, given, expected_errors):
         result = parser(given, loc, config)
-        assert isinstance(result, Invalid)
-        assert result.value == given
-        assert result.errors == tuple(
-            [ErrorFactoryHelper.invalid_literal(loc, allowed_values=tuple(supported_values))]
-        )
+        assert_invalid(result, given, expected_errors)
 
 
 class TestAnnotated:
+    # Constraint objects are compared by identity, so each annotated type is
+    # built once to let the rows share a single cached parser
+    INT_1_10 = Annotated[int, MinValue(1), MaxValue(10)]
+    INT_1_2 = Annotated[int, MinValue(1), MaxValue(2)]
+    FLOAT_0_1 = Annotated[float, MinValue(0), MaxValue(1)]
 
     @pytest.mark.parametrize(
         "tp, given, expected",
         [
-            (Annotated[int, MinValue(1), MaxValue(10)], 1, 1),
-            (Annotated[int, MinValue(1), MaxValue(10)], "10", 10),
-            (Annotated[float, MinValue(0), MaxValue(1)], "0", 0.0),
-            (Annotated[float, MinValue(0), MaxValue(1)], "1", 1.0),
+            (INT_1_10, 1, 1),
+            (INT_1_10, "10", 10),
+            (FLOAT_0_1, "0", 0.0),
+            (FLOAT_0_1, "1", 1.0),
         ],
     )
     def test_successfully_parse_annotated_type(self, parser: IParser, loc, config, given, expected):
@@ -377,42 +340,42 @@ class TestAnnotated:
                 Annotated[int, MinValue(0)],
                 "spam",
                 "spam",
-                ErrorFactoryHelper.integer_required(Loc()),
+                _INT_REQ,
             ),
             (
-                Annotated[int, MinValue(1), MaxValue(10)],
+                INT_1_10,
                 "0",
                 0,
-                ErrorFactoryHelper.value_too_low(Loc(), min_inclusive=1),
+                _TOO_LOW_MIN_1,
             ),
             (
-                Annotated[int, MinValue(1), MaxValue(10)],
+                INT_1_10,
                 "11",
                 11,
-                ErrorFactoryHelper.value_too_high(Loc(), max_inclusive=10),
+                ErrorFactoryHelper.value_too_high(_EMPTY_LOC, max_inclusive=10),
             ),
             (
-                Annotated[int, MinValue(1), MaxValue(2)],
+                INT_1_2,
                 0,
                 0,
-                ErrorFactoryHelper.value_too_low(Loc(), min_inclusive=1),
+                _TOO_LOW_MIN_1,
             ),
             (
-                Annotated[int, MinValue(1), MaxValue(2)],
+                INT_1_2,
                 3,
                 3,
-                ErrorFactoryHelper.value_too_high(Loc(), max_inclusive=2),
+                ErrorFactoryHelper.value_too_high(_EMPTY_LOC, max_inclusive=2),
             ),
         ],
+        ids=["not-int", "str-below-min", "str-above-max", "int-below-min", "int-above-max"],
     )
     def test_parsing_fails_if_input_value_is_invalid(self, parser: IParser, given, invalid_value, loc, config, expected_error):
         result = parser(given, loc, config)
-        assert isinstance(result, Invalid)
-        assert result.value == invalid_value
-        assert result.errors == tuple([expected_error])
+        assert_invalid(result, invalid_value, (expected_error,))
 
 
-class TestOptionalParser:
+class TestUnionParser:
+    # Optional[T] is Union[T, None], so both are handled by the same parser
 
     @pytest.mark.parametrize(
         "tp, given, expected",
@@ -420,29 +383,6 @@ class TestOptionalParser:
             (Optional[int], 1, 1),
             (Optional[int], "2", 2),
             (Optional[int], None, None),
-        ],
-    )
-    def test_successfully_parse_input_value(self, parser: IParser, loc, config, given, expected):
-        assert parser(given, loc, config) == expected
-
-    @pytest.mark.parametrize(
-        "tp, given, supported_types",
-        [
-            (Optional[str], 123, (str, type(None))),
-        ],
-    )
-    def test_parsing_fails_if_input_cannot_be_parsed(self, parser: IParser, loc, config, given, supported_types):
-        result = parser(given, loc, config)
-        assert isinstance(result, Invalid)
-        assert result.value == given
-        assert result.errors == (ErrorFactoryHelper.unsupported_type(loc, supported_types),)
-
-
-class TestUnionParser:
-
-    @pytest.mark.parametrize(
-        "tp, given, expected",
-        [
             (Union[int, str], 123, 123),
             (Union[int, str], "123", "123"),
         ],
@@ -450,17 +390,20 @@ class TestUnionParser:
     def test_successfully_parse_input_value(self, parser: IParser, loc, config, given, expected):
         assert parser(given, loc, config) == expected
 
+    OPTIONAL_STR_TYPES = (str, type(None))
+    STR_INT_FLOAT_TYPES = (str, int, float)
+
     @pytest.mark.parametrize(
-        "tp, given, supported_types",
+        "tp, given, expected_errors",
         [
-            (Union[str, int, float], None, (str, int, float)),
+            (Optional[str], 123, (ErrorFactoryHelper.unsupported_type(_EMPTY_LOC, OPTIONAL_STR_TYPES),)),
+            (Union[str, int, float], None, (ErrorFactoryHelper.unsupported_type(_EMPTY_LOC, STR_INT_FLOAT_TYPES),)),
         ],
+        ids=["optional", "union"],
     )
-    def test_parsing_fails_if_input_cannot_be_parsed(self, parser: IParser, loc, config, given, supported_types):
+    def test_parsing_fails_if_input_cannot_be_parsed(self, parser: IParser, loc, config, given, expected_errors):
         result = parser(given, loc, config)
-        assert isinstance(result, Invalid)
-        assert result.value == given
-        assert result.errors == (ErrorFactoryHelper.unsupported_type(loc, supported_types),)
+        assert_invalid(result, given, expected_errors)
 
 
 class TestTupleParser:
@@ -468,7 +411,7 @@ class TestTupleParser:
     @pytest.mark.parametrize(
         "tp, given, expected",
         [
-            (tuple, [], tuple()),
+            (tuple, [], ()),
             (tuple, "123", ("1", "2", "3")),
             (Tuple[Any, ...], [1, 2, 3], (1, 2, 3)),
             (Tuple[int, ...], ["1", "2"], (1, 2)),
@@ -477,6 +420,16 @@ class TestTupleParser:
             (Tuple[tuple, ...], [(1,)], ((1,),)),
             (Tuple[Tuple[int]], [("1",)], ((1,),)),
         ],
+        ids=[
+            "any-empty",
+            "any-str",
+            "any-ellipsis",
+            "int-ellipsis",
+            "int-str",
+            "int-str-float",
+            "tuple-ellipsis",
+            "nested",
+        ],
     )
     def test_successfully_parse_input_value(self, parser: IParser, loc, config, given, expected):
         assert parser(given, loc, config) == expected
@@ -484,30 +437,21 @@ class TestTupleParser:
     @pytest.mark.parametrize(
         "tp, given, expected_errors",
         [
-            (tuple, None, (ErrorFactoryHelper.iterable_required(Loc()),)),
-            (Tuple[int, ...], None, (ErrorFactoryHelper.iterable_required(Loc()),)),
-            (Tuple[int, str, float], None, (ErrorFactoryHelper.iterable_required(Loc()),)),
-            (
-                Tuple[int, str, float],
-                ["1"],
-                (ErrorFactoryHelper.invalid_tuple_format(Loc(), expected_format=(int, str, float)),),
-            ),
-            (
-                Tuple[int, str, float],
-                ["foo"],
-                (ErrorFactoryHelper.invalid_tuple_format(Loc(), expected_format=(int, str, float)),),
-            ),
-            (
+            pytest.param(Tuple[int, str, float], ["1"], _INVALID_INT_STR_FLOAT_TUPLE, id="fixed-too-short"),
+            pytest.param(Tuple[int, str, float], ["foo"], _INVALID_INT_STR_FLOAT_TUPLE, id="fixed-too-short-invalid"),
+            pytest.param(
                 Tuple[int, str, float],
                 [123, "foo", "bar"],
                 (ErrorFactoryHelper.float_required(Loc(2)),),
+                id="fixed-invalid-last",
             ),
-            (
+            pytest.param(
                 Tuple[int, str, float],
                 ["spam", "foo", "3.14"],
                 (ErrorFactoryHelper.integer_required(Loc(0)),),
+                id="fixed-invalid-first",
             ),
-            (
+            pytest.param(
                 Tuple[int, str, float],
                 ["spam", 123, "dummy"],
                 (
@@ -515,21 +459,31 @@ class TestTupleParser:
                     ErrorFactoryHelper.string_required(Loc(1)),
                     ErrorFactoryHelper.float_required(Loc(2)),
                 ),
+                id="fixed-all-invalid",
             ),
-            (Tuple[int, ...], [1, 2, 3, "spam"], (ErrorFactoryHelper.integer_required(Loc(3)),)),
-            (Tuple[Tuple[int]], [1], (ErrorFactoryHelper.iterable_required(Loc(0)),)),
-            (
+            pytest.param(
+                Tuple[int, ...],
+                [1, 2, 3, "spam"],
+                (ErrorFactoryHelper.integer_required(Loc(3)),),
+                id="int-ellipsis-invalid",
+            ),
+            pytest.param(
+                Tuple[Tuple[int]],
+                [1],
+                (ErrorFactoryHelper.iterable_required(Loc(0)),),
+                id="nested-not-iterable",
+            ),
+            pytest.param(
                 Tuple[Tuple[int, ...]],
                 [["1", 2, "3", "spam", 4]],
                 (ErrorFactoryHelper.integer_required(Loc(0, 3)),),
+                id="nested-invalid",
             ),
         ],
     )
     def test_parsing_fails_if_input_cannot_be_parsed(self, parser: IParser, loc, config, given, expected_errors):
         result = parser(given, loc, config)
-        assert isinstance(result, Invalid)
-        assert result.value == given
-        assert result.errors == expected_errors
+        assert_invalid(result, given, expected_errors)
 
 
 class TestListParser:
@@ -543,6 +497,7 @@ class TestListParser:
             (List[int], [1, 2, "3"], [1, 2, 3]),
             (List[Union[int, str]], [1, 2, "foo"], [1, 2, "foo"]),
         ],
+        ids=["any-empty", "any-str", "list-any", "list-int", "list-union"],
     )
     def test_successfully_parse_input_value(self, parser: IParser, loc, config, given, expected):
         assert parser(given, loc, config) == expected
@@ -550,8 +505,6 @@ class TestListParser:
     @pytest.mark.parametrize(
         "tp, given, expected_errors",
         [
-            (list, None, (ErrorFactoryHelper.iterable_required(Loc()),)),
-            (list[int], None, (ErrorFactoryHelper.iterable_required(Loc()),)),
             (
                 List[int],
                 ["spam", 123, "dummy"],
@@ -561,146 +514,133 @@ class TestListParser:
                 ),
             ),
         ],
+        ids=["invalid-items"],
     )
     def test_parsing_fails_if_input_cannot_be_parsed(self, parser: IParser, loc, config, given, expected_errors):
         result = parser(given, loc, config)
-        assert isinstance(result, Invalid)
-        assert result.value == given
-        assert result.errors == expected_errors
-
-    class TestInterface:
-
-        @pytest.fixture
-        def tp(self):
-            return List[int]
-
-        @pytest.fixture
-        def sut(self, parser: IParser, initial_value, loc, config):
-            return parser(initial_value, loc, config)
-
-        @pytest.mark.parametrize(
-            "initial_value, given_list",
-            [
-                ([], []),
-                ([1, 2], [1, 2]),
-                (["1", 2, 3], [1, 2, 3]),
-            ],
-        )
-        def test_check_equality_of_two_lists(self, sut: list, given_list):
-            assert sut == given_list
-
-        @pytest.mark.parametrize(
-            "initial_value, expected_repr",
-            [
-                ([], "[]"),
-                ([1, 2], "[1, 2]"),
-                (["1"], "[1]"),
-            ],
-        )
-        def test_repr(self, sut: list, expected_repr):
-            assert repr(sut) == expected_repr
-
-        @pytest.mark.parametrize(
-            "initial_value, index, expected_result",
-            [
-                ([1], 0, []),
-            ],
-        )
-        def test_delitem(self, sut: list, index, expected_result):
+        assert_invalid(result, given, expected_errors)
+
+
+class TestListInterface:
+
+    @pytest.fixture
+    def sut(self, initial_value, loc, config):
+        return _LIST_INT_PARSER(initial_value, loc, config)
+
+    @pytest.mark.parametrize(
+        "initial_value, given_list",
+        [
+            ([], []),
+            ([1, 2], [1, 2]),
+            (["1", 2, 3], [1, 2, 3]),
+        ],
+    )
+    def test_check_equality_of_two_lists(self, sut: list, given_list):
+        assert sut == given_list
+
+    @pytest.mark.parametrize(
+        "initial_value, expected_repr",
+        [
+            ([], "[]"),
+            ([1, 2], "[1, 2]"),
+            (["1"], "[1]"),
+        ],
+    )
+    def test_repr(self, sut: list, expected_repr):
+        assert repr(sut) == expected_repr
+
+    @pytest.mark.parametrize(
+        "initial_value, index, expected_result",
+        [
+            ([1], 0, []),
+        ],
+    )
+    def test_delitem(self, sut: list, index, expected_result):
+        del sut[index]
+        assert sut == expected_result
+
+    @pytest.mark.parametrize(
+        "initial_value, index",
+        [
+            ([], 0),
+            ([1, 2], 2),
+        ],
+    )
+    def test_delitem_throws_index_error_if_index_is_invalid(self, sut: list, index):
+        with pytest.raises(IndexError) as excinfo:
             del sut[index]
-            assert sut == expected_result
-
-        @pytest.mark.parametrize(
-            "initial_value, index",
-            [
-                ([], 0),
-                ([1, 2], 2),
-            ],
-        )
-        def test_delitem_throws_index_error_if_index_is_invalid(self, sut: list, index):
-            with pytest.raises(IndexError) as excinfo:
-                del sut[index]
-            assert str(excinfo.value) == "list assignment index out of range"
-
-        @pytest.mark.parametrize(
-            "initial_value, index, expected_result",
-            [
-                ([1], 0, 1),
-                ([1, "2"], 1, 2),
-            ],
-        )
-        def test_getitem(self, sut: list, index, expected_result):
-            assert sut[index] == expected_result
-
-        @pytest.mark.parametrize(
-            "initial_value, index",
-            [
-                ([], 0),
-                ([1, 2], 2),
-            ],
-        )
-        def test_getitem_throws_index_error_if_index_is_invalid(self, sut: list, index):
-            with pytest.raises(IndexError) as excinfo:
-                _ = sut[index]
-            assert str(excinfo.value) == "list index out of range"
-
-        @pytest.mark.parametrize(
-            "initial_value, index, value, expected_result",
-            [
-                ([1], 0, 2, [2]),
-                ([1, 2], 0, "3", [3, 2]),
-                ([1, 2, 3], 2, "4", [1, 2, 4]),
-            ],
-        )
-        def test_setitem(self, sut: list, index, value, expected_result):
+        assert str(excinfo.value) == "list assignment index out of range"
+
+    @pytest.mark.parametrize(
+        "initial_value, index, expected_result",
+        [
+            ([1], 0, 1),
+            ([1, "2"], 1, 2),
+        ],
+    )
+    def test_getitem(self, sut: list, index, expected_result):
+        assert sut[index] == expected_result
+
+    @pytest.mark.parametrize(
+        "initial_value, index",
+        [
+            ([], 0),
+            ([1, 2], 2),
+        ],
+    )
+    def test_getitem_throws_index_error_if_index_is_invalid(self, sut: list, index):
+        with pytest.raises(IndexError) as excinfo:
+            _ = sut[index]
+        assert str(excinfo.value) == "list index out of range"
+
+    @pytest.mark.parametrize(
+        "initial_value, index, value, expected_result",
+        [
+            ([1], 0, "spam", [1]),
+        ],
+    )
+    def test_setitem_fails_if_invalid_input_given(self, sut: list, index, value, expected_result):
+        with pytest.raises(ParsingError) as excinfo:
             sut[index] = value
-            assert sut == expected_result
-
-        @pytest.mark.parametrize(
-            "initial_value, index, value, expected_result",
-            [
-                ([1], 0, "spam", [1]),
-            ],
-        )
-        def test_setitem_fails_if_invalid_input_given(self, sut: list, index, value, expected_result):
-            with pytest.raises(ParsingError) as excinfo:
-                sut[index] = value
-            assert sut == expected_result
-            assert excinfo.value.errors == (ErrorFactoryHelper.integer_required(Loc()),)
-
-        @pytest.mark.parametrize(
-            "initial_value, expected_length",
-            [
-                ([], 0),
-                ([1, 2, 3], 3),
-            ],
-        )
-        def test_length(self, sut: list, expected_length):
-            assert len(sut) == expected_length
-
-        @pytest.mark.parametrize(
-            "initial_value, index, value, expected_result",
-            [
-                ([], 0, "1", [1]),
-                ([2], 0, "1", [1, 2]),
-                ([1, 2], 1, "3", [1, 3, 2]),
-            ],
-        )
-        def test_insert_element_to_the_list(self, sut: list, index, value, expected_result):
-            sut.insert(index, value)
-            assert sut == expected_result
+        assert sut == expected_result
+        assert excinfo.value.errors == (_INT_REQ,)
+
+    @pytest.mark.parametrize(
+        "initial_value, expected_length",
+        [
+            ([], 0),
+            ([1, 2, 3], 3),
+        ],
+    )
+    def test_length(self, sut: list, expected_length):
+        assert len(sut) == expected_length
+
+    def test_setitem_and_insert_parse_values_being_added(self, loc, config):
+        sut = _LIST_INT_PARSER([], loc, config)
+        sut.insert(0, "1")
+        assert sut == [1]
+        sut[0] = 2
+        assert sut == [2]
+        sut.insert(0, "1")
+        assert sut == [1, 2]
+        sut.insert(1, "3")
+        assert sut == [1, 3, 2]
+        sut[0] = "4"
+        assert sut == [4, 3, 2]
+        sut[2] = "5"
+        assert sut == [4, 3, 5]
 
-        @pytest.mark.parametrize(
-            "initial_value, index, value, expected_result",
-            [
-                ([1], 0, "spam", [1]),
-            ],
-        )
-        def test_insert_fails_if_invalid_input_given(self, sut: list, index, value, expected_result):
-            with pytest.raises(ParsingError) as excinfo:
-                sut.insert(index, value)
-            assert sut == expected_result
-            assert excinfo.value.errors == (ErrorFactoryHelper.integer_required(Loc()),)
+    @pytest.mark.parametrize(
+        "initial_value, index, value, expected_result",
+        [
+            ([1], 0, "spam", [1]),
+        ],
+    )
+    def test_insert_fails_if_invalid_input_given(self, sut: list, index, value, expected_result):
+        with pytest.raises(ParsingError) as excinfo:
+            sut.insert(index, value)
+        assert sut == expected_result
+        assert excinfo.value.errors == (_INT_REQ,)
 
 
 class TestDictParser:
@@ -716,6 +656,7 @@ class TestDictParser:
             (Dict[str, Union[int, float]], {"foo": 1, "bar": "3.14"}, {"foo": 1, "bar": 3.14}),
             (Dict[str, List[int]], {"foo": [1, "2", "3"]}, {"foo": [1, 2, 3]}),
         ],
+        ids=["any-empty", "any-pairs", "str-int", "str-int-coerced", "int-str-coerced", "str-union", "str-list"],
     )
     def test_successfully_parse_input_value(self, parser: IParser, loc, config, given, expected):
         assert parser(given, loc, config) == expected
@@ -723,113 +664,113 @@ class TestDictParser:
     @pytest.mark.parametrize(
         "tp, given, expected_errors",
         [
-            (dict, None, (ErrorFactoryHelper.mapping_required(Loc()),)),
-            (dict, [1, 2, 3], (ErrorFactoryHelper.mapping_required(Loc()),)),
-            (
+            pytest.param(dict, [1, 2, 3], _MAP_REQ, id="any-not-mapping"),
+            pytest.param(
                 Dict[str, int],
                 [("one", "spam")],
                 (ErrorFactoryHelper.integer_required(Loc("one")),),
+                id="invalid-value",
+            ),
+            pytest.param(
+                Dict[int, str],
+                [("one", "spam")],
+                (_INT_REQ,),
+                id="invalid-key",
             ),
-            (Dict[int, str], [("one", "spam")], (ErrorFactoryHelper.integer_required(Loc()),)),
-            (Dict[int, str], None, (ErrorFactoryHelper.mapping_required(Loc()),)),
         ],
     )
     def test_parsing_fails_if_input_cannot_be_parsed(self, parser: IParser, loc, config, given, expected_errors):
         result = parser(given, loc, config)
-        assert isinstance(result, Invalid)
-        assert result.value == given
-        assert result.errors == expected_errors
-
-    class TestInterface:
-
-        @pytest.fixture
-        def tp(self):
-            return Dict[str, int]
-
-        @pytest.fixture
-        def sut(self, parser: IParser, initial, loc, config):
-            return parser(initial, loc, config)
-
-        @pytest.mark.parametrize(
-            "initial, expected_repr",
-            [
-                ({}, "{}"),
-            ],
-        )
-        def test_repr(self, sut: list, expected_repr):
-            assert repr(sut) == expected_repr
-
-        @pytest.mark.parametrize(
-            "initial, other",
-            [
-                ({}, {}),
-                ({"one": 1}, {"one": 1}),
-                ({"one": "1"}, {"one": 1}),
-            ],
-        )
-        def test_check_equality_of_two_dicts(self, sut: dict, other):
-            assert sut == other
-
-        @pytest.mark.parametrize(
-            "initial, key, value, expected_result",
-            [
-                ({}, "one", "2", {"one": 2}),
-            ],
-        )
-        def test_set_item_to_given_value(self, sut: dict, key, value, expected_result):
+        assert_invalid(result, given, expected_errors)
+
+
+class TestDictInterface:
+
+    @pytest.fixture
+    def sut(self, initial, loc, config):
+        return _DICT_STR_INT_PARSER(initial, loc, config)
+
+    @pytest.mark.parametrize(
+        "initial, expected_repr",
+        [
+            ({}, "{}"),
+        ],
+    )
+    def test_repr(self, sut: list, expected_repr):
+        assert repr(sut) == expected_repr
+
+    @pytest.mark.parametrize(
+        "initial, other",
+        [
+            ({}, {}),
+            ({"one": 1}, {"one": 1}),
+            ({"one": "1"}, {"one": 1}),
+        ],
+    )
+    def test_check_equality_of_two_dicts(self, sut: dict, other):
+        assert sut == other
+
+    @pytest.mark.parametrize(
+        "initial, key, value, expected_result",
+        [
+            ({}, "one", "2", {"one": 2}),
+        ],
+    )
+    def test_set_item_to_given_value(self, sut: dict, key, value, expected_result):
+        sut[key] = value
+        assert sut == expected_result
+
+    @pytest.mark.parametrize(
+        "initial, key, value, expected_errors",
+        [
+            ({}, "one", "spam", (_INT_REQ,)),
+            ({}, 1, 2, (_STR_REQ,)),
+        ],
+        ids=["invalid-value", "invalid-key"],
+    )
+    def test_setting_item_to_invalid_value_causes_parsing_error(
+        self, sut: dict, initial, key, value, expected_errors
+    ):
+        with pytest.raises(ParsingError) as excinfo:
             sut[key] = value
-            assert sut == expected_result
-
-        @pytest.mark.parametrize(
-            "initial, key, value, expected_errors",
-            [
-                ({}, "one", "spam", [ErrorFactoryHelper.integer_required(Loc())]),
-                ({}, 1, 2, [ErrorFactoryHelper.string_required(Loc())]),
-            ],
-        )
-        def test_setting_item_to_invalid_value_causes_parsing_error(
-            self, sut: dict, initial, key, value, expected_errors
-        ):
-            with pytest.raises(ParsingError) as excinfo:
-                sut[key] = value
-            assert sut == initial
-            assert excinfo.value.errors == tuple(expected_errors)
-
-        @pytest.mark.parametrize("initial, key, expected", [({"one": 1}, "one", {})])
-        def test_delete_item(self, sut: dict, key, expected):
+        assert sut == initial
+        assert excinfo.value.errors == expected_errors
+
+    @pytest.mark.parametrize("initial, key, expected", [({"one": 1}, "one", {})])
+    def test_delete_item(self, sut: dict, key, expected):
+        del sut[key]
+        assert sut == expected
+
+    @pytest.mark.parametrize("initial, key", [({"one": 1}, "two")])
+    def test_deleting_a_non_existing_key_causes_key_error(self, sut: dict, key):
+        with pytest.raises(KeyError) as excinfo:
             del sut[key]
-            assert sut == expected
-
-        @pytest.mark.parametrize("initial, key", [({"one": 1}, "two")])
-        def test_deleting_a_non_existing_key_causes_key_error(self, sut: dict, key):
-            with pytest.raises(KeyError) as excinfo:
-                del sut[key]
-            assert excinfo.value.args[0] == key
-
-        @pytest.mark.parametrize("initial, key, expected_value", [({"one": "1"}, "one", 1)])
-        def test_get_item(self, sut: dict, key, expected_value):
-            assert sut[key] == expected_value
-
-        @pytest.mark.parametrize("initial, key", [({"one": 1}, "two")])
-        def test_getting_a_non_existing_key_causes_key_error(self, sut: dict, key):
-            with pytest.raises(KeyError) as excinfo:
-                _ = sut[key]
-            assert excinfo.value.args[0] == key
-
-        @pytest.mark.parametrize("initial, expected_keys", [({"one": 1, "two": 2}, ["one", "two"])])
-        def test_iterator_yields_dict_keys(self, sut: dict, expected_keys):
-            assert list(iter(sut)) == expected_keys
-
-        @pytest.mark.parametrize(
-            "initial, expected_len",
-            [
-                ({}, 0),
-                ({"one": 1}, 1),
-                ({"one": 1, "two": 2}, 2),
-            ],
-        )
-        def test_len_returns_number_of_items(self, sut: dict, expected_len):
-            assert len(sut) == expected_len
+        assert excinfo.value.args[0] == key
+
+    @pytest.mark.parametrize("initial, key, expected_value", [({"one": "1"}, "one", 1)])
+    def test_get_item(self, sut: dict, key, expected_value):
+        assert sut[key] == expected_value
+
+    @pytest.mark.parametrize("initial, key", [({"one": 1}, "two")])
+    def test_getting_a_non_existing_key_causes_key_error(self, sut: dict, key):
+        with pytest.raises(KeyError) as excinfo:
+            _ = sut[key]
+        assert excinfo.value.args[0] == key
+
+    @pytest.mark.parametrize("initial, expected_keys", [({"one": 1, "two": 2}, ["one", "two"])])
+    def test_iterator_yields_dict_keys(self, sut: dict, expected_keys):
+        assert list(iter(sut)) == expected_keys
+
+    @pytest.mark.parametrize(
+        "initial, expected_len",
+        [
+            ({}, 0),
+            ({"one": 1}, 1),
+            ({"one": 1, "two": 2}, 2),
+        ],
+    )
+    def test_len_returns_number_of_items(self, sut: dict, expected_len):
+        assert len(sut) == expected_len
 
 
 class TestSetParser:
@@ -844,6 +785,7 @@ class TestSetParser:
             (Set[int], [], set()),
             (Set[int], ["1", "2", "2", "3"], {1, 2, 3}),
         ],
+        ids=["any-empty", "any-single", "any-set", "any-duplicates", "int-empty", "int-coerced"],
     )
     def test_successfully_parse_input_value(self, parser: IParser, loc, config, given, expected):
         assert parser(given, loc, config) == expected
@@ -851,80 +793,98 @@ class TestSetParser:
     @pytest.mark.parametrize(
         "tp, given, expected_errors",
         [
-            (set, None, [ErrorFactoryHelper.iterable_required(Loc())]),
-            (Set[int], None, [ErrorFactoryHelper.iterable_required(Loc())]),
-            (Set[int], [1, "spam"], [ErrorFactoryHelper.integer_required(Loc())]),
-            (Set[tuple], [1], [ErrorFactoryHelper.iterable_required(Loc())]),
-            (Set[list], [[1]], [ErrorFactoryHelper.hashable_required(Loc())]),
+            (Set[int], [1, "spam"], (_INT_REQ,)),
+            (Set[tuple], [1], _ITER_REQ),
+            (Set[list], [[1]], (ErrorFactoryHelper.hashable_required(_EMPTY_LOC),)),
         ],
+        ids=["invalid-item", "item-not-iterable", "item-not-hashable"],
     )
     def test_parsing_fails_if_input_cannot_be_parsed(self, parser: IParser, loc, config, given, expected_errors):
         result = parser(given, loc, config)
-        assert isinstance(result, Invalid)
-        assert result.value == given
-        assert result.errors == tuple(expected_errors)
-
-    class TestInterface:
-
-        @pytest.fixture
-        def tp(self):
-            return Set[int]
-
-        @pytest.fixture
-        def sut(self, parser: IParser, initial, loc, config):
-            return parser(initial, loc, config)
-
-        @pytest.mark.parametrize(
-            "initial, expected_repr",
-            [
-                (set(), "set()"),
-                ({1, "2"}, "{1, 2}"),
-            ],
-        )
-        def test_repr(self, sut: list, expected_repr):
-            assert repr(sut) == expected_repr
-
-        @pytest.mark.parametrize(
-            "initial, other",
-            [
-                (set(), set()),
-            ],
-        )
-        def test_check_equality_of_two_sets(self, sut: set, other):
-            assert sut == other
-
-        @pytest.mark.parametrize(
-            "initial, given, expected",
-            [
-                (set(), 1, {1}),
-                (set(), "2", {2}),
-            ],
-        )
-        def test_when_adding_valid_item_then_it_is_added_after_conversion(self, sut: set, given, expected):
-            sut.add(given)
-            assert sut == expected
-
-        @pytest.mark.parametrize(
-            "initial, given, expected_errors",
-            [
-                (set(), "foo", [ErrorFactoryHelper.integer_required(Loc())]),
-            ],
-        )
-        def test_when_adding_invalid_item_then_parsing_error_is_raised(self, sut: set, initial, given, expected_errors):
-            with pytest.raises(ParsingError) as excinfo:
-                sut.add(given)
-            assert sut == initial
-            assert excinfo.value.errors == tuple(expected_errors)
-
-        @pytest.mark.parametrize(
-            "initial, element, expected_result",
-            [
-                ({1, 2}, 2, {1}),
-            ],
-        )
-        def test_remove_element_from_set(self, sut: set, element, expected_result):
-            sut.discard(element)
-            assert sut == expected_result
+        assert_invalid(result, given, expected_errors)
+
+
+class TestSetInterface:
+
+    @pytest.fixture
+    def sut(self, initial, loc, config):
+        return _SET_INT_PARSER(initial, loc, config)
+
+    @pytest.fixture
+    def empty_sut(self, loc, config):
+        return _SET_INT_PARSER(set(), loc, config)
+
+    @pytest.mark.parametrize(
+        "initial, expected_repr",
+        [
+            (set(), "set()"),
+            ({1, "2"}, "{1, 2}"),
+        ],
+    )
+    def test_repr(self, sut: list, expected_repr):
+        assert repr(sut) == expected_repr
+
+    @pytest.mark.parametrize(
+        "initial, other",
+        [
+            (set(), set()),
+        ],
+    )
+    def test_check_equality_of_two_sets(self, sut: set, other):
+        assert sut == other
+
+    @pytest.mark.parametrize(
+        "given, expected",
+        [
+            (1, {1}),
+            ("2", {2}),
+        ],
+    )
+    def test_when_adding_valid_item_then_it_is_added_after_conversion(self, empty_sut: set, given, expected):
+        empty_sut.add(given)
+        assert empty_sut == expected
+
+    @pytest.mark.parametrize(
+        "given, expected_errors",
+        [
+            ("foo", (_INT_REQ,)),
+        ],
+    )
+    def test_when_adding_invalid_item_then_parsing_error_is_raised(self, empty_sut: set, given, expected_errors):
+        with pytest.raises(ParsingError) as excinfo:
+            empty_sut.add(given)
+        assert empty_sut == set()
+        assert excinfo.value.errors == expected_errors
+
+    @pytest.mark.parametrize(
+        "initial, element, expected_result",
+        [
+            ({1, 2}, 2, {1}),
+        ],
+    )
+    def test_remove_element_from_set(self, sut: set, element, expected_result):
+        sut.discard(element)
+        assert sut == expected_result
+
+
+@pytest.mark.parametrize(
+    "tp, expected_errors",
+    [
+        (tuple, _ITER_REQ),
+        (Tuple[int, ...], _ITER_REQ),
+        (Tuple[int, str, float], _ITER_REQ),
+        (list, _ITER_REQ),
+        (list[int], _ITER_REQ),
+        (dict, _MAP_REQ),
+        (Dict[int, str], _MAP_REQ),
+        (set, _ITER_REQ),
+        (Set[int], _ITER_REQ),
+    ],
+    ids=["tuple", "tuple-ellipsis", "tuple-fixed", "list", "list-pep585", "dict", "dict-typed", "set", "set-typed"],
+)
+def test_collection_parsing_fails_if_none_given(parser: IParser, loc, config, expected_errors):
+    result = parser(None, loc, config)
+    assert_invalid(result, None, expected_errors)
 
 
 class Dummy(Model):
@@ -940,6 +900,7 @@ class TestModelParser:
             (Dummy, Dummy(value=123), Dummy(value=123)),
             (Dummy, {"value": "123"}, Dummy(value=123)),
         ],
+        ids=["empty", "instance", "mapping"],
     )
     def test_successfully_parse_input_value(self, parser: IParser, loc, config, given, expected):
         assert parser(given, loc, config) == expected
@@ -947,14 +908,13 @@ class TestModelParser:
     @pytest.mark.parametrize(
         "tp, loc, given, expected_errors",
         [
-            (Dummy, Loc(), None, [ErrorFactoryHelper.invalid_model(Loc(), Dummy)]),
-            (Dummy, Loc("root"), None, [ErrorFactoryHelper.invalid_model(Loc("root"), Dummy)]),
-            (Dummy, Loc(), {"value": "spam"}, [ErrorFactoryHelper.integer_required(Loc("value"))]),
-            (Dummy, Loc("root"), {"value": "spam"}, [ErrorFactoryHelper.integer_required(Loc("root", "value"))]),
+            (Dummy, _EMPTY_LOC, None, (ErrorFactoryHelper.invalid_model(_EMPTY_LOC, Dummy),)),
+            (Dummy, Loc("root"), None, (ErrorFactoryHelper.invalid_model(Loc("root"), Dummy),)),
+            (Dummy, _EMPTY_LOC, {"value": "spam"}, (ErrorFactoryHelper.integer_required(Loc("value")),)),
+            (Dummy, Loc("root"), {"value": "spam"}, (ErrorFactoryHelper.integer_required(Loc("root", "value")),)),
         ],
+        ids=["none", "none-with-loc", "invalid-field", "invalid-field-with-loc"],
     )
     def test_parsing_fails_if_input_cannot_be_parsed(self, parser: IParser, loc, config, given, expected_errors):
         result = parser(given, loc, config)
-        assert isinstance(result, Invalid)
-        assert result.value == given
-        assert result.errors == tuple(expected_errors)
+        assert_invalid(result, given, expected_errors)
@@ -7,8 +7,14 @@ from modelity.loc import Loc
 from modelity.model import Config
 from tests.helpers import ErrorFactoryHelper
 
+_EMPTY_LOC = Loc()
+_TOO_LOW_INCLUSIVE = ErrorFactoryHelper.value_too_low(_EMPTY_LOC, min_inclusive=0)
+_TOO_LOW_EXCLUSIVE = ErrorFactoryHelper.value_too_low(_EMPTY_LOC, min_exclusive=0)
+_TOO_HIGH_INCLUSIVE = ErrorFactoryHelper.value_too_high(_EMPTY_LOC, max_inclusive=0)
+_TOO_HIGH_EXCLUSIVE = ErrorFactoryHelper.value_too_high(_EMPTY_LOC, max_exclusive=0)
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def config():
     return Config()
 
@@ -32,8 +38,8 @@ class TestMinValue:
     @pytest.mark.parametrize(
         "uut, value, loc",
         [
-            (MinValue(min_inclusive=0), 0, Loc()),
-            (MinValue(min_exclusive=0), 1, Loc()),
+            (MinValue(min_inclusive=0), 0, _EMPTY_LOC),
+            (MinValue(min_exclusive=0), 1, _EMPTY_LOC),
         ],
     )
     def test_constraint_checking_passed(self, uut, value, loc, config):
@@ -43,10 +49,11 @@ class TestMinValue:
     @pytest.mark.parametrize(
         "uut, value, loc, expected_error",
         [
-            (MinValue(min_inclusive=0), -1, Loc(), ErrorFactoryHelper.value_too_low(Loc(), min_inclusive=0)),
-            (MinValue(min_exclusive=0), -1, Loc(), ErrorFactoryHelper.value_too_low(Loc(), min_exclusive=0)),
-            (MinValue(min_exclusive=0), 0, Loc(), ErrorFactoryHelper.value_too_low(Loc(), min_exclusive=0)),
+            (MinValue(min_inclusive=0), -1, _EMPTY_LOC, _TOO_LOW_INCLUSIVE),
+            (MinValue(min_exclusive=0), -1, _EMPTY_LOC, _TOO_LOW_EXCLUSIVE),
+            (MinValue(min_exclusive=0), 0, _EMPTY_LOC, _TOO_LOW_EXCLUSIVE),
         ],
+        ids=["inclusive", "exclusive-below", "exclusive-equal"],
     )
     def test_constraint_checking_failed(self, uut, value, loc, expected_error, config):
         result = uut(value, loc, config)
@@ -74,8 +81,8 @@ class TestMaxValue:
     @pytest.mark.parametrize(
         "uut, value, loc",
         [
-            (MaxValue(max_inclusive=0), 0, Loc()),
-            (MaxValue(max_exclusive=0), -1, Loc()),
+            (MaxValue(max_inclusive=0), 0, _EMPTY_LOC),
+            (MaxValue(max_exclusive=0), -1, _EMPTY_LOC),
         ],
     )
     def test_constraint_checking_passed(self, uut, value, loc, config):
@@ -85,10 +92,11 @@ class TestMaxValue:
     @pytest.mark.parametrize(
         "uut, value, loc, expected_error",
         [
-            (MaxValue(max_inclusive=0), 1, Loc(), ErrorFactoryHelper.value_too_high(Loc(), max_inclusive=0)),
-            (MaxValue(max_exclusive=0), 1, Loc(), ErrorFactoryHelper.value_too_high(Loc(), max_exclusive=0)),
-            (MaxValue(max_exclusive=0), 0, Loc(), ErrorFactoryHelper.value_too_high(Loc(), max_exclusive=0)),
+            (MaxValue(max_inclusive=0), 1, _EMPTY_LOC, _TOO_HIGH_INCLUSIVE),
+            (MaxValue(max_exclusive=0), 1, _EMPTY_LOC, _TOO_HIGH_EXCLUSIVE),
+            (MaxValue(max_exclusive=0), 0, _EMPTY_LOC, _TOO_HIGH_EXCLUSIVE),
         ],
+        ids=["inclusive", "exclusive-above", "exclusive-equal"],
     )
     def test_constraint_checking_failed(self, uut, value, loc, config, expected_error):
         result = uut(value, loc, config)
@@ -102,7 +110,7 @@ class TestMinLength:
     @pytest.mark.parametrize(
         "uut, value, loc",
         [
-            (MinLength(3), "foo", Loc()),
+            (MinLength(3), "foo", _EMPTY_LOC),
         ],
     )
     def test_constraint_checking_passed(self, uut, value, loc):
@@ -112,7 +120,7 @@ class TestMinLength:
     @pytest.mark.parametrize(
         "uut, value, loc, expected_error",
         [
-            (MinLength(1), "", Loc(), ErrorFactoryHelper.value_too_short(Loc(), 1)),
+            (MinLength(1), "", _EMPTY_LOC, ErrorFactoryHelper.value_too_short(_EMPTY_LOC, 1)),
         ],
     )
     def test_constraint_checking_failed(self, uut, value, loc, config, expected_error):
@@ -127,7 +135,7 @@ class TestMaxLength:
     @pytest.mark.parametrize(
         "uut, value, loc",
         [
-            (MaxLength(3), "foo", Loc()),
+            (MaxLength(3), "foo", _EMPTY_LOC),
         ],
     )
     def test_constraint_checking_passed(self, uut, value, loc, config):
@@ -137,7 +145,7 @@ class TestMaxLength:
     @pytest.mark.parametrize(
         "uut, value, loc, expected_error",
         [
-            (MaxLength(1), "foo", Loc(), ErrorFactoryHelper.value_too_long(Loc(), 1)),
+            (MaxLength(1), "foo", _EMPTY_LOC, ErrorFactoryHelper.value_too_long(_EMPTY_LOC, 1)),
         ],
     )
     def test_constraint_checking_failed(self, uut, value, loc, config, expected_error):
@@ -0,0 +1,35 @@
+from modelity.error import Error
+from modelity.exc import ParsingError, ValidationError
+from modelity.loc import Loc
+
+_ERRORS = (
+    Error(Loc("foo", 1), "dummy.Code", {"a": 1}, "first message"),
+    Error(Loc("bar"), "dummy.Code", None, "second message"),
+)
+
+
+class TestParsingError:
+
+    def test_format_as_string(self):
+        assert str(ParsingError(_ERRORS)) == (
+            "parsing failed with 2 error(-s):\n"
+            "  bar:\n"
+            "    second message [code=dummy.Code, data=None]\n"
+            "  foo.1:\n"
+            "    first message [code=dummy.Code, data={'a': 1}]"
+        )
+
+
+class TestValidationError:
+
+    class Dummy:
+        pass
+
+    def test_format_as_string(self):
+        assert str(ValidationError(self.Dummy(), _ERRORS)) == (
+            "validation of model 'TestValidationError.Dummy' failed with 2 error(-s):\n"
+            "  bar:\n"
+            "    second message [code=dummy.Code, data=None]\n"
+            "  foo.1:\n"
+            "    first message [code=dummy.Code, data={'a': 1}]"
+        )
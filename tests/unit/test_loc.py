@@ -1,32 +1,25 @@
-import pytest
 from modelity.loc import Loc
 
 
 class TestLoc:
 
-    @pytest.mark.parametrize(
-        "uut, expected_repr",
-        [
+    def test_repr(self):
+        for uut, expected_repr in [
             (Loc(), "Loc()"),
             (Loc(1), "Loc(1)"),
             (Loc("foo"), "Loc('foo')"),
             (Loc("foo", "bar", 1), "Loc('foo', 'bar', 1)"),
-        ],
-    )
-    def test_repr(self, uut, expected_repr):
-        assert repr(uut) == expected_repr
+        ]:
+            assert repr(uut) == expected_repr
 
-    @pytest.mark.parametrize(
-        "uut, expected_str",
-        [
+    def test_str(self):
+        for uut, expected_str in [
             (Loc(), ""),
             (Loc("foo"), "foo"),
             (Loc(1), "1"),
             (Loc("foo", "bar", 2), "foo.bar.2"),
-        ],
-    )
-    def test_str(self, uut, expected_str):
-        assert str(uut) == expected_str
+        ]:
+            assert str(uut) == expected_str
 
     # @pytest.mark.parametrize("uut, index, expected", [
     #     (Loc(1), 0, 1),
@@ -45,27 +38,21 @@ class TestLoc:
     # def test_len(self, uut, expected):
     #     assert len(uut) == expected
 
-    @pytest.mark.parametrize(
-        "left, right, is_equal",
-        [
+    def test_eq_and_ne_operators(self):
+        for left, right, is_equal in [
             (Loc(), Loc(), True),
             (Loc(1), Loc(), False),
             (Loc(), Loc(1), False),
             (Loc(1), Loc(1), True),
             (Loc("foo"), Loc("foo", 2), False),
-        ],
-    )
-    def test_eq_and_ne_operators(self, left, right, is_equal):
-        assert (left == right) == is_equal
-        assert (left != right) == (not is_equal)
+        ]:
+            assert (left == right) == is_equal
+            assert (left != right) == (not is_equal)
 
-    @pytest.mark.parametrize(
-        "left, right, expected_sum",
-        [
+    def test_concatenate_two_locs(self):
+        for left, right, expected_sum in [
             (Loc(), Loc(), Loc()),
             (Loc(1), Loc(2), Loc(1, 2)),
             (Loc("foo", "bar"), Loc("baz", "spam", 3), Loc("foo", "bar", "baz", "spam", 3)),
-        ],
-    )
-    def test_concatenate_two_locs(self, left, right, expected_sum):
-        assert left + right == expected_sum
+        ]:
+            assert left + right == expected_sum
@@ -1,4 +1,5 @@
-from typing import Annotated, Dict, List, Optional, Set, Type
+import functools
+from typing import Annotated, Any, Dict, List, Optional, Set, Type
 
 import pytest
 
@@ -25,6 +26,48 @@ from modelity.unset import Unset
 from tests.helpers import ErrorFactoryHelper
 
 
+# Locations and expected errors shared by many tests below
+_EMPTY_LOC = Loc()
+_FOO_LOC = Loc("foo")
+_A_LOC = Loc("a")
+_INDEX_1_LOC = Loc(1)
+_FOO_1_LOC = Loc("foo", 1)
+_FOO_A_LOC = Loc("foo", "a")
+_NESTED_LOC = Loc("nested")
+_NESTED_A_LOC = Loc("nested", "a")
+_NESTED_FOO_LOC = Loc("nested", "foo")
+_NESTED_FOO_1_LOC = Loc("nested", "foo", 1)
+_CHILD_LOC = Loc("child")
+_CHILD_1_LOC = Loc("child", 1)
+_CHILD_FOO_LOC = Loc("child", "foo")
+
+_A_INTEGER_REQUIRED = ErrorFactoryHelper.integer_required(_A_LOC)
+_A_REQUIRED = ErrorFactoryHelper.required_missing(_A_LOC)
+_FOO_REQUIRED = ErrorFactoryHelper.required_missing(_FOO_LOC)
+_B_UNSUPPORTED_TYPE = ErrorFactoryHelper.unsupported_type(Loc("b"), supported_types=(str, type(None)))
+_VALUE_ERROR = ErrorFactoryHelper.value_error(_EMPTY_LOC, "an error")
+_TYPE_ERROR = ErrorFactoryHelper.type_error(_EMPTY_LOC, "an error")
+_FOO_VALUE_ERROR = ErrorFactoryHelper.value_error(_FOO_LOC, "an error")
+_FOO_TYPE_ERROR = ErrorFactoryHelper.type_error(_FOO_LOC, "an error")
+_FOO_1_VALUE_ERROR = ErrorFactoryHelper.value_error(_FOO_1_LOC, "an error")
+_NESTED_FOO_VALUE_ERROR = ErrorFactoryHelper.value_error(_NESTED_FOO_LOC, "an error")
+_NESTED_FOO_TYPE_ERROR = ErrorFactoryHelper.type_error(_NESTED_FOO_LOC, "an error")
+_CHILD_1_FOO_ERROR = ErrorFactoryHelper.value_error(_CHILD_1_LOC, "foo")
+_CHILD_1_BAR_ERROR = ErrorFactoryHelper.value_error(_CHILD_1_LOC, "bar")
+_DUMMY_VALUE_ERROR = ErrorFactoryHelper.value_error(Loc("dummy"), "an error")
+
+
+@functools.lru_cache(maxsize=None)
+def make_single_field_model(tp: Any) -> Type[Model]:
+    # Model types are built once per field type and shared between tests, so
+    # tests using this must not modify the returned type
+
+    class Dummy(Model):
+        foo: tp
+
+    return Dummy
+
+
 @pytest.fixture
 def initial_params():
     return {}
@@ -42,7 +85,7 @@ def config(model_type: Type[Model]):
 
 class TestModelType:
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def model_type(self):
 
         class Dummy(Model):
@@ -92,16 +135,16 @@ class TestModelType:
     @pytest.mark.parametrize(
         "initial_params, expected_errors",
         [
-            ({"a": "spam"}, [ErrorFactoryHelper.integer_required(Loc("a"))]),
+            ({"a": "spam"}, [_A_INTEGER_REQUIRED]),
             (
                 {"b": 123},
-                [ErrorFactoryHelper.unsupported_type(Loc("b"), supported_types=(str, type(None)))],
+                [_B_UNSUPPORTED_TYPE],
             ),
             (
                 {"a": "spam", "b": 123},
                 [
-                    ErrorFactoryHelper.integer_required(Loc("a")),
-                    ErrorFactoryHelper.unsupported_type(Loc("b"), supported_types=(str, type(None))),
+                    _A_INTEGER_REQUIRED,
+                    _B_UNSUPPORTED_TYPE,
                 ],
             ),
         ],
@@ -116,33 +159,18 @@ class TestModelType:
     @pytest.mark.parametrize(
         "name, value, expected_errors",
         [
-            ("a", "spam", [ErrorFactoryHelper.integer_required(Loc("a"))]),
+            ("a", "spam", [_A_INTEGER_REQUIRED]),
             (
                 "b",
                 123,
-                [ErrorFactoryHelper.unsupported_type(Loc("b"), supported_types=(str, type(None)))],
+                [_B_UNSUPPORTED_TYPE],
             ),
         ],
     )
     def test_setting_field_to_wrong_type_causes_parsing_error(self, model: Model, name, value, expected_errors):
         with pytest.raises(ParsingError) as excinfo:
             setattr(model, name, value)
-        assert excinfo.value.errors == tuple(expected_errors)
-
-    @pytest.mark.parametrize(
-        "name, value, expected_errors",
-        [
-            ("a", "spam", [ErrorFactoryHelper.integer_required(Loc("a"))]),
-            (
-                "b",
-                123,
-                [ErrorFactoryHelper.unsupported_type(Loc("b"), supported_types=(str, type(None)))],
-            ),
-        ],
-    )
-    def test_catch_parsing_errors_via_model_error_base_class(self, model: Model, name, value, expected_errors):
-        with pytest.raises(ModelError) as excinfo:
-            setattr(model, name, value)
+        assert isinstance(excinfo.value, ModelError)  # Parsing errors can be caught via base class
         assert excinfo.value.errors == tuple(expected_errors)
 
     def test_setting_attribute_fails_if_it_is_not_a_field(self, model: Model):
@@ -163,11 +191,10 @@ class TestModelType:
         with pytest.raises(ValidationError) as excinfo:
             model.validate()
         assert excinfo.value.model is model
-        assert excinfo.value.errors == tuple([ErrorFactoryHelper.required_missing(Loc("a"))])
+        assert excinfo.value.errors == tuple([_A_REQUIRED])
 
-    @pytest.mark.parametrize(
-        "left, right, is_equal",
-        [
+    def test_eq_and_ne_operators(self, model_type: Type[Model]):
+        cases = [
             ({}, {}, True),
             ({"a": 1}, {"a": 1}, True),
             ({"a": 1}, {"a": 2}, False),
@@ -178,13 +205,12 @@ class TestModelType:
             ({"c": 2.71}, {"c": 3.14}, False),
             ({"d": "spam"}, {}, True),
             ({"d": "spam"}, {"d": "more spam"}, False),
-        ],
-    )
-    def test_eq_and_ne_operators(self, model_type: Type[Model], left, right, is_equal):
-        left = model_type(**left)
-        right = model_type(**right)
-        assert (left == right) == is_equal
-        assert (left != right) == (not is_equal)
+        ]
+        for left_params, right_params, is_equal in cases:
+            left = model_type(**left_params)
+            right = model_type(**right_params)
+            assert (left == right) == is_equal, (left_params, right_params)
+            assert (left != right) == (not is_equal), (left_params, right_params)
 
     def test_iterating_over_model_yields_fields_that_are_currently_set_in_field_declaration_order(
         self, model_type: Type[Model]
@@ -241,31 +267,23 @@ class TestModelType:
     @pytest.mark.parametrize(
         "params, expected_errors",
         [
-            ({"foo": "spam"}, [ErrorFactoryHelper.integer_required(Loc("foo"))]),
+            ({"foo": "spam"}, [ErrorFactoryHelper.integer_required(_FOO_LOC)]),
         ],
     )
     def test_load_valid_fails_on_parsing_error_if_wrong_value_is_given_for_field(self, params, expected_errors):
-
-        class Dummy(Model):
-            foo: int
-
         with pytest.raises(ParsingError) as excinfo:
-            Dummy.load_valid(params)
+            make_single_field_model(int).load_valid(params)
         assert excinfo.value.errors == tuple(expected_errors)
 
     @pytest.mark.parametrize(
         "params, expected_errors",
         [
-            ({}, [ErrorFactoryHelper.required_missing(Loc("foo"))]),
+            ({}, [_FOO_REQUIRED]),
         ],
     )
     def test_load_valid_fails_on_validation_error_if_validation_errors_are_found(self, params, expected_errors):
-
-        class Dummy(Model):
-            foo: int
-
         with pytest.raises(ValidationError) as excinfo:
-            Dummy.load_valid(params)
+            make_single_field_model(int).load_valid(params)
         assert excinfo.value.errors == tuple(expected_errors)
 
     class TestModelTypeDeclaration:
@@ -295,10 +313,7 @@ class TestModelType:
         )
         def test_dump_scalar_field(self, tp, given, expected):
 
-            class Dummy(Model):
-                foo: tp
-
-            uut = Dummy(**given)
+            uut = make_single_field_model(tp)(**given)
             assert uut.dump() == expected
 
         @pytest.mark.parametrize(
@@ -313,10 +328,7 @@ class TestModelType:
         )
         def test_dump_mapping_field(self, key_type, value_type, given, expected):
 
-            class Dummy(Model):
-                foo: Dict[key_type, value_type]
-
-            uut = Dummy(**given)
+            uut = make_single_field_model(Dict[key_type, value_type])(**given)
             assert uut.dump() == expected
 
         @pytest.mark.parametrize(
@@ -335,10 +347,7 @@ class TestModelType:
         )
         def test_dump_sequence_field(self, value_type, given, expected):
 
-            class Dummy(Model):
-                foo: List[value_type]
-
-            uut = Dummy(**given)
+            uut = make_single_field_model(List[value_type])(**given)
             assert uut.dump() == expected
 
         @pytest.mark.parametrize(
@@ -352,10 +361,7 @@ class TestModelType:
         )
         def test_dump_set_field(self, value_type, given, expected):
 
-            class Dummy(Model):
-                foo: Set[value_type]
-
-            uut = Dummy(**given)
+            uut = make_single_field_model(Set[value_type])(**given)
             assert uut.dump() == expected
 
         @pytest.mark.parametrize(
@@ -365,14 +371,10 @@ class TestModelType:
                 ({"foo": {}}, {"foo": {"a": Unset}}),
                 ({"foo": {"a": "1"}}, {"foo": {"a": 1}}),
             ],
+            ids=["unset", "empty", "filled"],
         )
         def test_dump_model_field(self, given, expected):
-            Nested = self.Nested
-
-            class Dummy(Model):
-                foo: Nested
-
-            uut = Dummy(**given)
+            uut = make_single_field_model(self.Nested)(**given)
             assert uut.dump() == expected
 
         class TestDumpModelWithCustomFilter:
@@ -383,7 +385,7 @@ class TestModelType:
                     a: int
 
                 uut = Dummy()
-                mock.expect_call(Unset, Loc("a")).will_once(Return((Unset, True)))
+                mock.expect_call(Unset, _A_LOC).will_once(Return((Unset, True)))
                 assert uut.dump(mock) == {}
 
             def test_return_another_value(self, mock):
@@ -392,31 +394,33 @@ class TestModelType:
                     a: int
 
                 uut = Dummy(a=1)
-                mock.expect_call(1, Loc("a")).will_once(Return((11, False)))
+                mock.expect_call(1, _A_LOC).will_once(Return((11, False)))
                 assert uut.dump(mock) == {"a": 11}
 
-        class TestDumpMappingWithCustomFilter:
-
-            def test_skip_fields(self, mock):
+            def test_dump_same_model_with_different_filters(self):
 
                 class Dummy(Model):
-                    foo: Dict[str, int]
+                    a: int
+                    b: int
+
+                uut = Dummy(a=1, b=2)
+                cases = [
+                    ("keep-all", lambda v, l: (v, False), {"a": 1, "b": 2}),
+                    ("skip-a", lambda v, l: (v, l == _A_LOC), {"b": 2}),
+                    ("double", lambda v, l: (v * 2, False), {"a": 2, "b": 4}),
+                ]
+                for case_id, func, expected in cases:
+                    assert uut.dump(func) == expected, case_id
 
-                uut = Dummy(foo={"one": "1", "two": 2})
-                mock.expect_call({"one": 1, "two": 2}, Loc("foo")).will_once(Invoke(lambda v, l: (v, False)))
+        class TestDumpMappingWithCustomFilter:
+
+            def test_skip_fields(self, mock):
+                uut = make_single_field_model(Dict[str, int])(foo={"one": "1", "two": 2})
+                mock.expect_call({"one": 1, "two": 2}, _FOO_LOC).will_once(Invoke(lambda v, l: (v, False)))
                 mock.expect_call(1, Loc("foo", "one")).will_once(Return((1, True)))
                 mock.expect_call(2, Loc("foo", "two")).will_once(Return((2, False)))
                 assert uut.dump(mock) == {"foo": {"two": 2}}
 
-            def test_return_another_value(self, mock):
-
-                class Dummy(Model):
-                    a: int
-
-                uut = Dummy(a=1)
-                mock.expect_call(1, Loc("a")).will_once(Return((11, False)))
-                assert uut.dump(mock) == {"a": 11}
-
         class TestDumpStrByteBytearraySubclasses:
 
             class Str(str):
@@ -447,8 +451,17 @@ class TestModelType:
         class TestDumpWithFunc:
 
             @pytest.fixture
-            def func(self):
-                return lambda v, l: (v, False)  # False - don't skip
+            def calls(self):
+                return []
+
+            @pytest.fixture
+            def func(self, calls: list):
+
+                def func(v, l):
+                    calls.append((v, l))
+                    return v, False  # False - don't skip
+
+                return func
 
             @pytest.mark.parametrize(
                 "tp, given, expected",
@@ -459,46 +472,31 @@ class TestModelType:
                     (bool, "true", True),
                 ],
             )
-            def test_visit_scalar_field(self, mock, tp, given, expected, func):
-
-                class Dummy(Model):
-                    foo: tp
-
-                uut = Dummy(foo=given)
-                mock.expect_call(expected, Loc("foo")).will_once(Invoke(func))
-                with ordered(mock):
-                    assert uut.dump(mock)["foo"] == expected
-
-            def test_visit_mapping_field(self, mock, func):
-
-                class Dummy(Model):
-                    foo: Dict[str, int]
+            def test_visit_scalar_field(self, tp, given, expected, func, calls):
+                uut = make_single_field_model(tp)(foo=given)
+                assert uut.dump(func)["foo"] == expected
+                assert calls == [(expected, _FOO_LOC)]
 
+            def test_visit_mapping_field(self, func, calls):
                 foo = {"a": 1, "b": 2}
-                uut = Dummy(foo=foo)
-                mock.expect_call(foo, Loc("foo")).will_once(Invoke(func))
-                mock.expect_call(1, Loc("foo", "a")).will_once(Invoke(func))
-                mock.expect_call(2, Loc("foo", "b")).will_once(Invoke(func))
-                with ordered(mock):
-                    assert uut.dump(mock) == {"foo": foo}
-
-            def test_visit_mapping_field_with_values_being_another_mapping(self, mock, func):
-
-                class Dummy(Model):
-                    foo: Dict[str, Dict[str, int]]
+                uut = make_single_field_model(Dict[str, int])(foo=foo)
+                assert uut.dump(func) == {"foo": foo}
+                assert calls == [(foo, Loc("foo")), (1, Loc("foo", "a")), (2, Loc("foo", "b"))]
 
+            def test_visit_mapping_field_with_values_being_another_mapping(self, func, calls):
                 foo = {"a": {"b": 1}, "c": {"d": 2, "e": 3}}
-                uut = Dummy(foo=foo)
-                mock.expect_call(foo, Loc("foo")).will_once(Invoke(func))
-                mock.expect_call({"b": 1}, Loc("foo", "a")).will_once(Invoke(func))
-                mock.expect_call(1, Loc("foo", "a", "b")).will_once(Invoke(func))
-                mock.expect_call({"d": 2, "e": 3}, Loc("foo", "c")).will_once(Invoke(func))
-                mock.expect_call(2, Loc("foo", "c", "d")).will_once(Invoke(func))
-                mock.expect_call(3, Loc("foo", "c", "e")).will_once(Invoke(func))
-                with ordered(mock):
-                    assert uut.dump(mock) == {"foo": foo}
+                uut = make_single_field_model(Dict[str, Dict[str, int]])(foo=foo)
+                assert uut.dump(func) == {"foo": foo}
+                assert calls == [
+                    (foo, Loc("foo")),
+                    ({"b": 1}, Loc("foo", "a")),
+                    (1, Loc("foo", "a", "b")),
+                    ({"d": 2, "e": 3}, Loc("foo", "c")),
+                    (2, Loc("foo", "c", "d")),
+                    (3, Loc("foo", "c", "e")),
+                ]
 
-            def test_visit_nested_model(self, mock, func):
+            def test_visit_nested_model(self, func, calls):
 
                 class Foo(Model):
                     a: int
@@ -508,10 +506,8 @@ class TestModelType:
 
                 foo = {"a": 1}
                 uut = Bar(foo=foo)
-                mock.expect_call(Foo(a=1), Loc("foo")).will_once(Invoke(func))
-                mock.expect_call(1, Loc("foo", "a")).will_once(Invoke(func))
-                with ordered(mock):
-                    assert uut.dump(mock) == {"foo": foo}
+                assert uut.dump(func) == {"foo": foo}
+                assert calls == [(Foo(a=1), _FOO_LOC), (1, _FOO_A_LOC)]
 
             @pytest.mark.parametrize(
                 "tp, given, expected",
@@ -519,17 +515,10 @@ class TestModelType:
                     (int, ["1", "2"], [1, 2]),
                 ],
             )
-            def test_visit_sequence_field(self, mock, tp, given, expected, func):
-
-                class Dummy(Model):
-                    foo: List[tp]
-
-                uut = Dummy(foo=given)
-                mock.expect_call(expected, Loc("foo")).will_once(Invoke(func))
-                for i, val in enumerate(expected):
-                    mock.expect_call(val, Loc("foo", i)).will_once(Invoke(func))
-                with ordered(mock):
-                    assert uut.dump(mock) == {"foo": expected}
+            def test_visit_sequence_field(self, tp, given, expected, func, calls):
+                uut = make_single_field_model(List[tp])(foo=given)
+                assert uut.dump(func) == {"foo": expected}
+                assert calls == [(expected, _FOO_LOC)] + [(val, Loc("foo", i)) for i, val in enumerate(expected)]
 
     class TestCustomConfig:
 
@@ -579,65 +568,31 @@ class TestModelType:
                 a: int
 
             mock.provide_type_parser.expect_call(int, Dummy.__config__).will_once(Return(mock.parse_int))
-            mock.parse_int.expect_call("123", Loc("a"), Dummy.__config__).will_once(Return(123))
+            mock.parse_int.expect_call("123", _A_LOC, Dummy.__config__).will_once(Return(123))
             dummy = Dummy(a="123")
             assert dummy.a == 123
 
     class TestInheritance:
 
-        @pytest.fixture
-        def model_type(self):
-
-            class Base(Model):
-                a: int
-
-            class Child(Base):
-                b: int
-                c: int
-
-            return Child
-
-        @pytest.fixture
-        def expected_fields(self):
-            return [
-                ("a", BoundField(name="a", type=int)),
-                ("b", BoundField(name="b", type=int)),
-                ("c", BoundField(name="c", type=int)),
-            ]
-
-        def test_fields_declared_in_base_model_are_inherited_by_child_model(
-            self, model_type: Type[Model], expected_field_names
-        ):
-            assert list(model_type.__fields__.keys()) == expected_field_names
-
-    class TestMixinInheritance:
+        class Base(Model):
+            a: int
 
-        @pytest.fixture
-        def model_type(self):
+        class Child(Base):
+            b: int
+            c: int
 
-            class Foo:
-                a: int
+        class Foo:
+            a: int
 
-            class Bar:
-                b: int
+        class Bar:
+            b: int
 
-            class Dummy(Model, Foo, Bar):
-                c: int
+        class Mixed(Model, Foo, Bar):
+            c: int
 
-            return Dummy
-
-        @pytest.fixture
-        def expected_fields(self):
-            return [
-                ("a", BoundField(name="a", type=int)),
-                ("b", BoundField(name="b", type=int)),
-                ("c", BoundField(name="c", type=int)),
-            ]
-
-        def test_fields_declared_in_base_model_are_inherited_by_child_model(
-            self, model_type: Type[Model], expected_field_names
-        ):
-            assert list(model_type.__fields__.keys()) == expected_field_names
+        @pytest.mark.parametrize("model_type", [Child, Mixed], ids=["model-base", "mixin-bases"])
+        def test_fields_declared_in_base_model_are_inherited_by_child_model(self, model_type: Type[Model]):
+            assert list(model_type.__fields__.keys()) == ["a", "b", "c"]
 
     class TestValidation:
 
@@ -649,7 +604,7 @@ class TestModelType:
             dummy = Dummy()
             with pytest.raises(ValidationError) as excinfo:
                 dummy.validate()
-            assert excinfo.value.errors == tuple([ErrorFactoryHelper.required_missing(Loc("a"))])
+            assert excinfo.value.errors == tuple([_A_REQUIRED])
 
         def test_validation_errors_can_be_caught_using_model_error_type(self):
 
@@ -659,7 +614,7 @@ class TestModelType:
             dummy = Dummy()
             with pytest.raises(ModelError) as excinfo:
                 dummy.validate()
-            assert excinfo.value.errors == tuple([ErrorFactoryHelper.required_missing(Loc("a"))])
+            assert excinfo.value.errors == tuple([_A_REQUIRED])
 
         def test_validate_nested_model(self):
 
@@ -672,7 +627,7 @@ class TestModelType:
             dummy = Dummy(nested=Nested())
             with pytest.raises(ValidationError) as excinfo:
                 dummy.validate()
-            assert excinfo.value.errors == tuple([ErrorFactoryHelper.required_missing(Loc("nested", "a"))])
+            assert excinfo.value.errors == tuple([ErrorFactoryHelper.required_missing(_NESTED_A_LOC)])
 
         def test_validate_nested_model_wrapped_in_mapping(self):
 
@@ -711,11 +666,11 @@ class TestModelType:
             assert dummy.foo == [1, 2, 3, 4]
             with pytest.raises(ValidationError) as excinfo:
                 dummy.validate()
-            assert excinfo.value.errors == tuple([ErrorFactoryHelper.value_too_long(Loc("foo"), 3)])
+            assert excinfo.value.errors == tuple([ErrorFactoryHelper.value_too_long(_FOO_LOC, 3)])
 
     class TestGetValue:
 
-        @pytest.fixture
+        @pytest.fixture(scope="class")
         def model_type(self):
 
             class Nested(Model):
@@ -734,10 +689,10 @@ class TestModelType:
         @pytest.mark.parametrize(
             "initial_params, loc, expected_result",
             [
-                ({}, Loc("a"), None),
-                ({}, Loc("foo"), None),
-                ({"foo": 1}, Loc("foo"), 1),
-                ({"nested": {"a": 2}}, Loc("nested", "a"), 2),
+                ({}, _A_LOC, None),
+                ({}, _FOO_LOC, None),
+                ({"foo": 1}, _FOO_LOC, 1),
+                ({"nested": {"a": 2}}, _NESTED_A_LOC, 2),
                 ({"mapping": {3: "three"}}, Loc("mapping", 3), "three"),
                 ({"nested_mapping": {4: {"a": 444}}}, Loc("nested_mapping", 4, "a"), 444),
                 ({"list": [111, 222, 333]}, Loc("list", 0), 111),
@@ -750,17 +705,34 @@ class TestModelType:
                 ({"list": [111, 222, 333]}, Loc("list", -4), None),
                 ({"nested_list": [{"a": 5}]}, Loc("nested_list", 0, "a"), 5),
             ],
+            ids=[
+                "unknown-field",
+                "unset-field",
+                "scalar",
+                "nested-model",
+                "mapping",
+                "nested-mapping",
+                "list-first",
+                "list-middle",
+                "list-last",
+                "list-past-end",
+                "list-negative-last",
+                "list-negative-middle",
+                "list-negative-first",
+                "list-negative-past-start",
+                "nested-list",
+            ],
         )
         def test_get_value(self, model: Model, loc, expected_result):
             assert model.get_value(loc) == expected_result
 
         def test_when_memo_used_then_getting_same_loc_returns_memoized_value(self, model: Model, mock):
             model.foo = 123
-            mock.get.expect_call(Loc("foo"), Unset).will_once(Return(Unset))
-            mock.__setitem__.expect_call(Loc("foo"), 123)
-            assert model.get_value(Loc("foo"), mock) == 123
-            mock.get.expect_call(Loc("foo"), Unset).will_once(Return(123))
-            assert model.get_value(Loc("foo"), mock) == 123
+            mock.get.expect_call(_FOO_LOC, Unset).will_once(Return(Unset))
+            mock.__setitem__.expect_call(_FOO_LOC, 123)
+            assert model.get_value(_FOO_LOC, mock) == 123
+            mock.get.expect_call(_FOO_LOC, Unset).will_once(Return(123))
+            assert model.get_value(_FOO_LOC, mock) == 123
 
 
 class TestNestedModel:
@@ -768,7 +740,7 @@ class TestNestedModel:
     class Child(Model):
         foo: int
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def model_type(self):
 
         class Parent(Model):
@@ -789,9 +761,10 @@ class TestNestedModel:
     @pytest.mark.parametrize(
         "initial_params, expected_errors",
         [
-            ({}, [ErrorFactoryHelper.required_missing(Loc("child"))]),
-            ({"child": {}}, [ErrorFactoryHelper.required_missing(Loc("child", "foo"))]),
+            ({}, [ErrorFactoryHelper.required_missing(_CHILD_LOC)]),
+            ({"child": {}}, [ErrorFactoryHelper.required_missing(_CHILD_FOO_LOC)]),
         ],
+        ids=["child-missing", "foo-missing"],
     )
     def test_create_invalid_model(self, model: Model, expected_errors):
         with pytest.raises(ValidationError) as excinfo:
@@ -812,9 +785,10 @@ class TestNestedModel:
     @pytest.mark.parametrize(
         "given_child, expected_errors",
         [
-            (None, [ErrorFactoryHelper.invalid_model(Loc("child"), Child)]),
-            ({"foo": "spam"}, [ErrorFactoryHelper.integer_required(Loc("child", "foo"))]),
+            (None, [ErrorFactoryHelper.invalid_model(_CHILD_LOC, Child)]),
+            ({"foo": "spam"}, [ErrorFactoryHelper.integer_required(_CHILD_FOO_LOC)]),
         ],
+        ids=["none", "invalid-foo"],
     )
     def test_set_child_attribute_to_invalid_value(self, model: Model, given_child, expected_errors):
         with pytest.raises(ParsingError) as excinfo:
@@ -830,7 +804,7 @@ class TestNestedModel:
         model.child = {}
         with pytest.raises(ParsingError) as excinfo:
             model.child.foo = "spam"
-        assert excinfo.value.errors == tuple([ErrorFactoryHelper.integer_required(Loc("child", "foo"))])
+        assert excinfo.value.errors == tuple([ErrorFactoryHelper.integer_required(_CHILD_FOO_LOC)])
 
 
 class TestFieldValidator:
@@ -871,15 +845,15 @@ class TestFieldValidator:
                 "foo",
                 "123",
                 123,
-                ErrorFactoryHelper.value_error(Loc("foo"), "an error"),
-                ErrorFactoryHelper.value_error(Loc("foo"), "an error"),
+                _FOO_VALUE_ERROR,
+                _FOO_VALUE_ERROR,
             ),
             (
                 "foo",
                 "123",
                 123,
-                ErrorFactoryHelper.value_error(Loc("foo", 1), "an error"),
-                ErrorFactoryHelper.value_error(Loc("foo", 1), "an error"),
+                _FOO_1_VALUE_ERROR,
+                _FOO_1_VALUE_ERROR,
             ),
         ],
     )
@@ -900,15 +874,15 @@ class TestFieldValidator:
                 "foo",
                 "123",
                 123,
-                [ErrorFactoryHelper.value_error(Loc("foo"), "an error")],
-                [ErrorFactoryHelper.value_error(Loc("foo"), "an error")],
+                [_FOO_VALUE_ERROR],
+                [_FOO_VALUE_ERROR],
             ),
             (
                 "foo",
                 "123",
                 123,
-                [ErrorFactoryHelper.value_error(Loc("foo", 1), "an error")],
-                [ErrorFactoryHelper.value_error(Loc("foo", 1), "an error")],
+                [_FOO_1_VALUE_ERROR],
+                [_FOO_1_VALUE_ERROR],
             ),
         ],
     )
@@ -925,8 +899,8 @@ class TestFieldValidator:
     @pytest.mark.parametrize(
         "name, value, exception, expected_error",
         [
-            ("foo", 123, ValueError("an error"), ErrorFactoryHelper.value_error(Loc("foo"), "an error")),
-            ("foo", 123, TypeError("an error"), ErrorFactoryHelper.type_error(Loc("foo"), "an error")),
+            ("foo", 123, ValueError("an error"), _FOO_VALUE_ERROR),
+            ("foo", 123, TypeError("an error"), _FOO_TYPE_ERROR),
         ],
     )
     def test_when_validator_raises_value_or_type_error_then_it_is_converted_to_error(
@@ -1002,36 +976,37 @@ class TestFieldValidator:
         mock.expect_call(root)
         root.validate()
 
-    def test_declare_validator_with_loc_only(self, mock):
+    def test_declare_validator_with_loc_only(self):
+        calls = []
+
         class Nested(Model):
             foo: int
 
             @field_validator()
             def _validate_all(loc):
-                return mock(loc)
+                calls.append(loc)
 
         class Dummy(Model):
             nested: Nested
 
         dummy = Dummy(nested={"foo": 123})
-        mock.expect_call(Loc("nested", "foo"))
-        with ordered(mock):
-            dummy.validate()
+        dummy.validate()
+        assert calls == [_NESTED_FOO_LOC]
+
+    def test_declare_validator_with_name_only(self):
+        calls = []
 
-    def test_declare_validator_with_name_only(self, mock):
         class Dummy(Model):
             foo: int
             bar: int
 
             @field_validator()
             def _validate_all(name):
-                return mock(name)
+                calls.append(name)
 
         dummy = Dummy(foo=123, bar=456)
-        mock.expect_call("foo")
-        mock.expect_call("bar")
-        with ordered(mock):
-            dummy.validate()
+        dummy.validate()
+        assert calls == ["foo", "bar"]
 
     def test_declare_validator_with_value_only(self, mock):
         class Dummy(Model):
@@ -1133,8 +1108,8 @@ class TestFieldValidator:
                     model.validate()
             assert excinfo.value.errors == tuple(
                 [
-                    ErrorFactoryHelper.value_error(Loc("foo"), "first error"),
-                    ErrorFactoryHelper.value_error(Loc("foo"), "second error"),
+                    ErrorFactoryHelper.value_error(_FOO_LOC, "first error"),
+                    ErrorFactoryHelper.value_error(_FOO_LOC, "second error"),
                 ]
             )
 
@@ -1225,23 +1200,24 @@ class TestModelValidator:
         "validator_action, expected_errors",
         [
             (
-                Return(ErrorFactoryHelper.value_error(Loc(), "an error")),
-                [ErrorFactoryHelper.value_error(Loc(), "an error")],
+                Return(_VALUE_ERROR),
+                [_VALUE_ERROR],
             ),
             (
-                Return(tuple([ErrorFactoryHelper.value_error(Loc(), "an error")])),
-                [ErrorFactoryHelper.value_error(Loc(), "an error")],
+                Return((_VALUE_ERROR,)),
+                [_VALUE_ERROR],
             ),
             (
-                Raise(ValueError("foo")),
-                [ErrorFactoryHelper.value_error(Loc(), "foo")],
+                Raise(ValueError("an error")),
+                [_VALUE_ERROR],
             ),
             (
-                Raise(TypeError("bar")),
-                [ErrorFactoryHelper.type_error(Loc(), "bar")],
+                Raise(TypeError("an error")),
+                [_TYPE_ERROR],
             ),
             (Return(None), []),
         ],
+        ids=["return-error", "return-errors", "raise-value-error", "raise-type-error", "return-none"],
     )
     def test_model_validator_is_called_after_built_in_validators(
         self, model: Model, mock, validator_action, expected_errors
@@ -1249,7 +1225,7 @@ class TestModelValidator:
         mock.expect_call().will_once(validator_action)
         with pytest.raises(ValidationError) as excinfo:
             model.validate()
-        assert excinfo.value.errors == (ErrorFactoryHelper.required_missing(Loc("foo")),) + tuple(expected_errors)
+        assert excinfo.value.errors == (_FOO_REQUIRED,) + tuple(expected_errors)
 
     def test_when_declared_with_wrong_signature_then_type_error_is_raised(self):
         with pytest.raises(TypeError) as excinfo:
@@ -1310,7 +1286,7 @@ class TestModelValidator:
             nested: Nested
 
         dummy = Dummy(nested={"foo": 123})
-        mock.expect_call(Loc("nested"))
+        mock.expect_call(_NESTED_LOC)
         dummy.validate()
 
     def test_declare_with_errors_only(self, mock):
@@ -1323,7 +1299,7 @@ class TestModelValidator:
                 return mock(errors)
 
         dummy = Dummy()
-        mock.expect_call([ErrorFactoryHelper.required_missing(Loc("foo"))])
+        mock.expect_call([_FOO_REQUIRED])
         with pytest.raises(ValidationError):
             dummy.validate()
 
@@ -1451,7 +1427,7 @@ class TestModelValidator:
             mock.child.expect_call(model.child, model).will_once(Raise(ValueError("an error")))
             with pytest.raises(ValidationError) as excinfo:
                 model.validate()
-            assert excinfo.value.errors == tuple([ErrorFactoryHelper.value_error(Loc("child"), "an error")])
+            assert excinfo.value.errors == tuple([ErrorFactoryHelper.value_error(_CHILD_LOC, "an error")])
 
         @pytest.mark.parametrize("initial_params", [{"foo": 1, "child": {"bar": 2}}])
         def test_when_child_validator_fails_with_tuple_of_errors_then_reported_errors_contain_proper_error_location(
@@ -1460,8 +1436,8 @@ class TestModelValidator:
             mock.child.expect_call(model.child, model).will_once(
                 Return(
                     [
-                        ErrorFactoryHelper.value_error(Loc("child", 1), "foo"),
-                        ErrorFactoryHelper.value_error(Loc("child", 1), "bar"),
+                        _CHILD_1_FOO_ERROR,
+                        _CHILD_1_BAR_ERROR,
                     ]
                 )
             )
@@ -1469,8 +1445,8 @@ class TestModelValidator:
                 model.validate()
             assert excinfo.value.errors == tuple(
                 [
-                    ErrorFactoryHelper.value_error(Loc("child", 1), "foo"),
-                    ErrorFactoryHelper.value_error(Loc("child", 1), "bar"),
+                    _CHILD_1_FOO_ERROR,
+                    _CHILD_1_BAR_ERROR,
                 ]
             )
 
@@ -1483,14 +1459,14 @@ class TestModelValidator:
 
                 @model_validator()
                 def _validate_model(errors: List[Error]):
-                    errors.append(Error(Loc("foo"), "CUSTOM_ERROR"))
+                    errors.append(Error(_FOO_LOC, "CUSTOM_ERROR"))
 
             dummy = Dummy(foo=123)
             with pytest.raises(ValidationError) as excinfo:
                 dummy.validate()
             assert excinfo.value.errors == tuple(
                 [
-                    Error(Loc("foo"), "CUSTOM_ERROR"),
+                    Error(_FOO_LOC, "CUSTOM_ERROR"),
                 ]
             )
 
@@ -1516,7 +1492,7 @@ class TestModelValidator:
 
                 @model_validator(pre=True)
                 def _validate_model():
-                    return ErrorFactoryHelper.value_error(Loc("dummy"), "an error")
+                    return _DUMMY_VALUE_ERROR
 
             return Dummy
 
@@ -1524,8 +1500,8 @@ class TestModelValidator:
             with pytest.raises(ValidationError) as excinfo:
                 model.validate()
             assert excinfo.value.errors == (
-                ErrorFactoryHelper.value_error(Loc("dummy"), "an error"),
-                ErrorFactoryHelper.required_missing(Loc("foo")),
+                _DUMMY_VALUE_ERROR,
+                _FOO_REQUIRED,
             )
 
 
@@ -1565,8 +1541,8 @@ class TestWrapFieldProcessor:
             return mock(loc)
 
         wrapped = _wrap_field_processor(func)
-        mock.expect_call(Loc("foo")).will_once(Return(123))
-        result = wrapped(type(model), Loc("foo"), "foo", "spam", config)
+        mock.expect_call(_FOO_LOC).will_once(Return(123))
+        result = wrapped(type(model), _FOO_LOC, "foo", "spam", config)
         assert result == 123
 
     def test_wrap_function_with_name_arg_only(self, model: Model, mock, config):
@@ -1614,21 +1590,21 @@ class TestWrapFieldProcessor:
     @pytest.mark.parametrize(
         "given_exc, model_loc, field_name, field_value, expected_error",
         [
-            (ValueError("an error"), Loc(), "foo", 123, ErrorFactoryHelper.value_error(Loc("foo"), "an error")),
+            (ValueError("an error"), _EMPTY_LOC, "foo", 123, _FOO_VALUE_ERROR),
             (
                 ValueError("an error"),
-                Loc("nested"),
+                _NESTED_LOC,
                 "foo",
                 123,
-                ErrorFactoryHelper.value_error(Loc("nested", "foo"), "an error"),
+                _NESTED_FOO_VALUE_ERROR,
             ),
-            (TypeError("an error"), Loc(), "foo", 123, ErrorFactoryHelper.type_error(Loc("foo"), "an error")),
+            (TypeError("an error"), _EMPTY_LOC, "foo", 123, _FOO_TYPE_ERROR),
             (
                 TypeError("an error"),
-                Loc("nested"),
+                _NESTED_LOC,
                 "foo",
                 123,
-                ErrorFactoryHelper.type_error(Loc("nested", "foo"), "an error"),
+                _NESTED_FOO_TYPE_ERROR,
             ),
         ],
     )
@@ -1649,9 +1625,9 @@ class TestWrapFieldProcessor:
     @pytest.mark.parametrize(
         "field_name, field_value, model_loc, given_loc, expected_loc",
         [
-            ("foo", 123, Loc(), Loc(), Loc("foo")),
-            ("foo", 123, Loc(), Loc(1), Loc("foo", 1)),
-            ("foo", 123, Loc("nested"), Loc(1), Loc("nested", "foo", 1)),
+            ("foo", 123, _EMPTY_LOC, _EMPTY_LOC, _FOO_LOC),
+            ("foo", 123, _EMPTY_LOC, _INDEX_1_LOC, _FOO_1_LOC),
+            ("foo", 123, _NESTED_LOC, _INDEX_1_LOC, _NESTED_FOO_1_LOC),
         ],
     )
     def test_if_wrapped_func_returns_invalid_object_then_new_invalid_object_with_updated_loc_is_returned(
@@ -1706,10 +1682,12 @@ class TestPreprocessor:
         assert model.bar == 456
 
     def test_when_invalid_is_return_then_parsing_error_is_raised(self, model_type: Type[Model], mock):
-        mock.expect_call("foo", "spam").will_once(Return(Invalid("spam", Error(Loc(), ErrorCode.VALUE_ERROR, msg="an error"))))
+        mock.expect_call("foo", "spam").will_once(
+            Return(Invalid("spam", Error(_EMPTY_LOC, ErrorCode.VALUE_ERROR, msg="an error")))
+        )
         with pytest.raises(ParsingError) as excinfo:
             model_type(foo="spam")
-        assert excinfo.value.errors == tuple([ErrorFactoryHelper.value_error(Loc("foo"), "an error")])
+        assert excinfo.value.errors == (_FOO_VALUE_ERROR,)
 
     class TestPreprocessorForOneFieldOnly:
 
@@ -1775,7 +1753,7 @@ class TestPreprocessor:
             mock.first.expect_call("foo", 1).will_once(Raise(ValueError("an error")))
             with pytest.raises(ParsingError) as excinfo:
                 _ = model_type(foo=1)
-            assert excinfo.value.errors == tuple([ErrorFactoryHelper.value_error(Loc("foo"), "an error")])
+            assert excinfo.value.errors == (_FOO_VALUE_ERROR,)
 
     class TestInheritedPreprocessors:
 
@@ -1869,7 +1847,7 @@ class TestPreprocessor:
             mock.expect_call("foo", 1).will_once(Raise(ValueError("an error")))
             with pytest.raises(ParsingError) as excinfo:
                 _ = model_type(nested={"foo": 1})
-            assert excinfo.value.errors == tuple([ErrorFactoryHelper.value_error(Loc("nested", "foo"), "an error")])
+            assert excinfo.value.errors == (_NESTED_FOO_VALUE_ERROR,)
 
 
 class TestPostprocessor:
@@ -1906,10 +1884,12 @@ class TestPostprocessor:
         assert model.bar == 22
 
     def test_when_invalid_is_return_then_parsing_error_is_raised(self, model_type: Type[Model], mock):
-        mock.expect_call("foo", 1).will_once(Return(Invalid(1, Error(Loc(), ErrorCode.VALUE_ERROR, msg="an error"))))
+        mock.expect_call("foo", 1).will_once(
+            Return(Invalid(1, Error(_EMPTY_LOC, ErrorCode.VALUE_ERROR, msg="an error")))
+        )
         with pytest.raises(ParsingError) as excinfo:
             model_type(foo="1")
-        assert excinfo.value.errors == tuple([ErrorFactoryHelper.value_error(Loc("foo"), "an error")])
+        assert excinfo.value.errors == (_FOO_VALUE_ERROR,)
 
     def test_postprocessor_is_not_called_when_value_is_invalid(self, model_type: Type[Model]):
         with pytest.raises(ParsingError) as excinfo:
@@ -1980,7 +1960,7 @@ class TestPostprocessor:
             mock.first.expect_call("foo", 1).will_once(Raise(ValueError("an error")))
             with pytest.raises(ParsingError) as excinfo:
                 _ = model_type(foo="1")
-            assert excinfo.value.errors == tuple([ErrorFactoryHelper.value_error(Loc("foo"), "an error")])
+            assert excinfo.value.errors == (_FOO_VALUE_ERROR,)
 
     class TestInheritedPostprocessors:
 
@@ -2074,4 +2054,4 @@ class TestPostprocessor:
             mock.expect_call("foo", 1).will_once(Raise(ValueError("an error")))
             with pytest.raises(ParsingError) as excinfo:
                 _ = model_type(nested={"foo": "1"})
-            assert excinfo.value.errors == tuple([ErrorFactoryHelper.value_error(Loc("nested", "foo"), "an error")])
+            assert excinfo.value.errors == (_NESTED_FOO_VALUE_ERROR,)
@@ -69,17 +69,6 @@ class TestTypeParserProvider:
             == "incorrect type parser factory signature: (tp, provider) is not a subsequence of (tp, model_config)"
         )
 
-    def test_register_type_parser_factory_for_simple_type(self, uut: TypeParserProvider, mock, model_config):
-
-        @uut.type_parser_factory(int)
-        def make_int_parser(tp):
-            return mock(tp)
-
-        mock.expect_call(int).will_once(Return(mock.parse_int))
-        parser = uut.provide_type_parser(int, model_config)
-        mock.parse_int.expect_call("123", Loc()).will_once(Return(123))
-        assert parser("123", Loc()) == 123
-
     def test_register_type_parser_factory_for_simple_type(self, uut: TypeParserProvider, mock, model_config):
 
         @uut.type_parser_factory(int)